@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-import asyncio
 import os
-import signal
 import sys
+from typing import TYPE_CHECKING, NamedTuple
 
-from loguru import logger
+if TYPE_CHECKING:
+    from packages.bootstrap import BootstrappedRuntime
 
-from packages.bootstrap import BootstrappedRuntime, bootstrap_runtime, load_app_config
+
+def _log_level(default: str) -> str:
+    """NEKOBOT_LOG_LEVEL 覆盖全部日志输出的级别，未设置时使用 default。"""
+    return os.environ.get("NEKOBOT_LOG_LEVEL", "").strip().upper() or default
 
 
 def _configure_logging() -> None:
+    # loguru 及框架仅在真正启动服务时导入，--help 等路径保持零依赖
+    from loguru import logger
+
     logger.remove()
     logger.add(
         sys.stdout,
@@ -18,14 +24,17 @@ def _configure_logging() -> None:
             "<green>{time:YYYY-MM-DD HH:mm:ss}</green> "
             "<level>[{level}]</level> {message}"
         ),
-        level="INFO",
-        colorize=True,
+        level=_log_level("INFO"),
+        # 仅在终端输出时着色：重定向到文件或容器日志时省去 ANSI 转义
+        colorize=sys.stdout.isatty(),
     )
     log_dir = os.environ.get("NEKOBOT_LOG_DIR", "data/logs")
+    # 文件日志默认保留 DEBUG；生产环境可设 NEKOBOT_LOG_LEVEL=INFO，
+    # 使逐帧的 debug 日志在级别检查处即被丢弃，不再格式化和写盘
     logger.add(
         f"{log_dir}/nekobot_{{time:YYYY-MM-DD}}.log",
         format="{time:YYYY-MM-DD HH:mm:ss} [{level}] {message}",
-        level="DEBUG",
+        level=_log_level("DEBUG"),
         rotation="00:00",
         retention="14 days",
         encoding="utf-8",
@@ -40,6 +49,13 @@ async def async_main(
     host: str | None = None,
     port: int | None = None,
 ) -> BootstrappedRuntime:
+    import asyncio
+    import signal
+
+    from loguru import logger
+
+    from packages.bootstrap import bootstrap_runtime, load_app_config
+
     config = load_app_config(config_path)
     runtime = await bootstrap_runtime(config)
 
@@ -124,47 +140,133 @@ def _resolve_webui_flag(cli_value: bool | None) -> bool | None:
     return None  # 未指定，交由配置文件决定
 
 
-def main() -> None:
-    import argparse
-    parser = argparse.ArgumentParser(description="NekoBot — 多平台 AI 机器人框架")
-    parser.add_argument(
-        "--webui",
-        action=argparse.BooleanOptionalAction,
-        default=None,
-        help=(
-            "启用或禁用 WebUI 管理面板（默认启用）。"
-            "也可通过环境变量 NEKOBOT_WEBUI=false 禁用。"
-        ),
-    )
-    parser.add_argument(
-        "--config",
-        type=str,
-        default=None,
-        help="指定配置文件路径（默认 data/config.json）",
-    )
-    parser.add_argument(
-        "--host",
-        type=str,
-        default=os.environ.get("NEKOBOT_HOST"),
-        help="WebUI 监听地址（默认 0.0.0.0）",
-    )
-    parser.add_argument(
-        "--port",
-        type=int,
-        default=int(os.environ.get("NEKOBOT_PORT", "0")) or None,
-        help="WebUI 监听端口（默认 6285）",
-    )
-    args = parser.parse_args()
+_HELP_TEXT = (
+    "usage: main.py [-h] [--webui | --no-webui] [--config CONFIG] [--host HOST] [--port PORT]\n"
+    "\n"
+    "NekoBot — 多平台 AI 机器人框架\n"
+    "\n"
+    "options:\n"
+    "  -h, --help           显示帮助并退出\n"
+    "  --webui, --no-webui  启用或禁用 WebUI 管理面板（默认启用）。"
+    "也可通过环境变量 NEKOBOT_WEBUI=false 禁用。\n"
+    "  --config CONFIG      指定配置文件路径（默认 data/config.json）\n"
+    "  --host HOST          WebUI 监听地址（默认 0.0.0.0）\n"
+    "  --port PORT          WebUI 监听端口（默认 6285）\n"
+)
+
+
+def _eager_tasks_enabled() -> bool:
+    """NEKOBOT_EAGER_TASKS=1 时为事件循环启用 asyncio.eager_task_factory（默认关闭）。"""
+    return os.environ.get("NEKOBOT_EAGER_TASKS", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class _CliOptions(NamedTuple):
+    webui: bool | None
+    config: str | None
+    host: str | None
+    port: int | None
+    show_help: bool = False
+
+
+def show_help() -> int:
+    sys.stdout.write(_HELP_TEXT)
+    return 0
+
+
+_OPTIONS = ("--help", "--webui", "--no-webui", "--config", "--host", "--port")
+
+
+def _expand_option(name: str) -> str:
+    """与 argparse 一致，接受长选项的唯一前缀缩写（如 ``--po`` → ``--port``）。"""
+    if name in _OPTIONS or not name.startswith("--") or len(name) < 3:
+        return name
+    matches = [opt for opt in _OPTIONS if opt.startswith(name)]
+    if len(matches) > 1:
+        raise ValueError(f"ambiguous option: {name} could match {', '.join(matches)}")
+    return matches[0] if matches else name
+
+
+def _parse_args(argv: list[str]) -> _CliOptions:
+    """解析命令行参数。只有四个选项，手写分支以免 argparse 的初始化开销。
+
+    参数非法时抛出 ValueError。出现在选项位置的 ``-h`` / ``--help`` 立即结束解析，
+    作为选项值出现时（如 ``--config -h``）按缺少参数处理，与 argparse 一致。
+    ``--port 0`` 原样保留为 0；环境变量 ``NEKOBOT_PORT=0`` 则视为未设置。
+    """
+    env_port = os.environ.get("NEKOBOT_PORT", "").strip()
+    webui: bool | None = None
+    config: str | None = None
+    host: str | None = os.environ.get("NEKOBOT_HOST")
+    port_raw: str | None = None
+
+    args = iter(argv)
+    for arg in args:
+        if arg == "-h":
+            return _CliOptions(webui=None, config=None, host=None, port=None, show_help=True)
+        name, sep, inline = arg.partition("=")
+        name = _expand_option(name)
+        if name == "--help" and not sep:
+            return _CliOptions(webui=None, config=None, host=None, port=None, show_help=True)
+        if name == "--webui" and not sep:
+            webui = True
+            continue
+        if name == "--no-webui" and not sep:
+            webui = False
+            continue
+        if name not in ("--config", "--host", "--port"):
+            raise ValueError(f"unrecognized argument: {arg}")
+        value = inline if sep else next(args, None)
+        if value is None or (not sep and value.startswith("-")):
+            raise ValueError(f"argument {name}: expected one argument")
+        if name == "--config":
+            config = value
+        elif name == "--host":
+            host = value
+        else:
+            port_raw = value
+
+    port: int | None = None
+    if port_raw is not None:
+        port = _parse_port(port_raw)
+    elif env_port:
+        port = _parse_port(env_port) or None
+    return _CliOptions(webui=webui, config=config, host=host, port=port)
+
+
+def _parse_port(raw: str) -> int:
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"argument --port: invalid int value: {raw!r}") from None
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        args = _parse_args(argv)
+    except ValueError as exc:
+        print(f"main.py: error: {exc}", file=sys.stderr)
+        return 2
+    if args.show_help:
+        return show_help()
     enable_webui = _resolve_webui_flag(args.webui)
 
+    # 只有服务路径需要事件循环；--help / 参数错误路径不导入 asyncio
+    import asyncio
+
     _configure_logging()
-    asyncio.run(async_main(
-        config_path=args.config,
-        enable_webui=enable_webui,
-        host=args.host,
-        port=args.port
-    ))
+    with asyncio.Runner() as runner:
+        if _eager_tasks_enabled():
+            # 协程在首次挂起前同步执行，省去不挂起任务的一次调度往返
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+        runner.run(async_main(
+            config_path=args.config,
+            enable_webui=enable_webui,
+            host=args.host,
+            port=args.port
+        ))
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,3 +1,9 @@
+from __future__ import annotations
+
+import importlib
+import os
+from typing import TYPE_CHECKING
+
 try:
     from importlib.metadata import version as _pkg_version
     __version__: str = _pkg_version("nekobot")
@@ -11,17 +17,36 @@ except Exception:
     except Exception:
         __version__ = "0.0.0"
 
-from .app import NekoBotFramework, create_framework
-from .conversations import (
-    ConfigurationContext,
-    ConversationContext,
-    ConversationResolver,
-)
-from .moderation import ModerationService
-from .permissions import PermissionEngine
-from .plugins import BasePlugin
-from .providers import ChatProvider, ProviderRegistry
-from .runtime import EffectivePluginBinding, ExecutionContext, PluginContext
+if TYPE_CHECKING:
+    from .app import NekoBotFramework, create_framework
+    from .conversations import (
+        ConfigurationContext,
+        ConversationContext,
+        ConversationResolver,
+    )
+    from .moderation import ModerationService
+    from .permissions import PermissionEngine
+    from .plugins import BasePlugin
+    from .providers import ChatProvider, ProviderRegistry
+    from .runtime import EffectivePluginBinding, ExecutionContext, PluginContext
+
+# 顶层导出按需解析：``import packages`` 不再拖入整个框架（CLI / 子模块导入场景）。
+# name → (相对子模块, 属性名)
+_LAZY: dict[str, tuple[str, str]] = {
+    "BasePlugin": (".plugins", "BasePlugin"),
+    "ChatProvider": (".providers", "ChatProvider"),
+    "ConfigurationContext": (".conversations", "ConfigurationContext"),
+    "ConversationContext": (".conversations", "ConversationContext"),
+    "ConversationResolver": (".conversations", "ConversationResolver"),
+    "EffectivePluginBinding": (".runtime", "EffectivePluginBinding"),
+    "ExecutionContext": (".runtime", "ExecutionContext"),
+    "ModerationService": (".moderation", "ModerationService"),
+    "NekoBotFramework": (".app", "NekoBotFramework"),
+    "PermissionEngine": (".permissions", "PermissionEngine"),
+    "PluginContext": (".runtime", "PluginContext"),
+    "ProviderRegistry": (".providers", "ProviderRegistry"),
+    "create_framework": (".app", "create_framework"),
+}
 
 __all__ = [
     "__version__",
@@ -39,3 +64,24 @@ __all__ = [
     "ProviderRegistry",
     "create_framework",
 ]
+
+
+def __getattr__(name: str) -> object:
+    spec = _LAZY.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = spec
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
+
+# CI 可设置 NEKOBOT_EAGER_IMPORT=1 立即解析全部导出，尽早暴露导入错误
+if os.environ.get("NEKOBOT_EAGER_IMPORT", "").strip().lower() in ("1", "true", "yes", "on"):
+    for _name in _LAZY:
+        __getattr__(_name)
+    del _name
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, cast
@@ -73,7 +74,10 @@ def save_app_config_raw(payload: dict[str, Any], path: Path) -> None:
     """直接保存原始字典到文件（包含加密逻辑）。"""
     encrypted = encrypt_secrets(payload)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(encrypted, indent=4, ensure_ascii=False), encoding="utf-8")
+    # 先写同目录临时文件再原子替换：写入中途崩溃不会留下截断的配置文件
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(json.dumps(encrypted, indent=4, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
 
 def save_app_config(config: BootstrapConfig, path: str | Path | None = None) -> None:
     config_path = Path(path) if path is not None else DEFAULT_CONFIG_PATH
@@ -61,10 +61,13 @@ def _annotation_to_json_schema(annotation: object) -> dict[str, Any]:
     """Convert a single Python type annotation to a JSON Schema fragment."""
     if annotation is inspect.Parameter.empty or annotation is None:
         return {}
+    return _unwrapped_to_json_schema(_is_optional(annotation)[1])
 
-    optional, inner = _is_optional(annotation)
-    if optional:
-        annotation = inner
+
+def _unwrapped_to_json_schema(annotation: object) -> dict[str, Any]:
+    """Like :func:`_annotation_to_json_schema`, for an annotation already stripped of ``Optional``."""
+    if annotation is inspect.Parameter.empty or annotation is None:
+        return {}
 
     origin = get_origin(annotation)
 
@@ -82,13 +85,29 @@ def _annotation_to_json_schema(annotation: object) -> dict[str, Any]:
 
     # Plain types
     if isinstance(annotation, type):
-        json_type = _PY_TO_JSON.get(annotation)
+        json_type = _json_type_of(annotation)
         if json_type:
             return {"type": json_type}
 
     return {}
 
 
+def _json_type_of(tp: type) -> str | None:
+    """Map a class to its JSON type, falling back along ``__mro__``.
+
+    Subclasses of the builtin types (``StrEnum``, ``IntEnum``, custom
+    ``str`` / ``dict`` subclasses) resolve to their builtin base.
+    """
+    json_type = _PY_TO_JSON.get(tp)
+    if json_type is not None:
+        return json_type
+    for base in tp.__mro__[1:]:
+        json_type = _PY_TO_JSON.get(base)
+        if json_type is not None:
+            return json_type
+    return None
+
+
 def _schema_from_fn(fn: Callable[..., Any]) -> dict[str, Any]:
     """Build a JSON Schema ``object`` from a function's type annotations.
 
@@ -96,27 +115,32 @@ def _schema_from_fn(fn: Callable[..., Any]) -> dict[str, Any]:
     an unconstrained property (``{}``). Parameters with default values are
     omitted from ``required``.
     """
+    sig = inspect.signature(fn)
+    params = [
+        param
+        for param_name, param in sig.parameters.items()
+        if param_name not in ("self", "cls")
+        and param.kind
+        not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    ]
+    # 无参工具无需解析注解（get_type_hints 会求值全部注解，包括返回值）
+    if not params:
+        return {"type": "object", "properties": {}}
+
     try:
         hints = get_type_hints(fn)
     except Exception:
         hints = {}
 
-    sig = inspect.signature(fn)
     properties: dict[str, dict[str, Any]] = {}
     required: list[str] = []
 
-    for param_name, param in sig.parameters.items():
-        if param_name in ("self", "cls"):
-            continue
-        if param.kind in (
-            inspect.Parameter.VAR_POSITIONAL,
-            inspect.Parameter.VAR_KEYWORD,
-        ):
-            continue
-
+    for param in params:
+        param_name = param.name
         annotation = hints.get(param_name, inspect.Parameter.empty)
-        optional_flag, _ = _is_optional(annotation)
-        prop_schema = _annotation_to_json_schema(annotation)
+        # 拆出的内层类型直接传下去，避免对同一注解再做一次 Optional 解析
+        optional_flag, inner = _is_optional(annotation)
+        prop_schema = _unwrapped_to_json_schema(inner)
 
         # Use the docstring of the param if available via Annotated metadata
         # (plain annotations have no per-param doc, so we leave description empty)
@@ -26,7 +26,7 @@ class KnowledgeDocument:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     document_id: str
     chunk_index: int
@@ -36,7 +36,7 @@ async def _noop_recall(message_id: str) -> None:
     _ = message_id
 
 
-@dataclass
+@dataclass(slots=True)
 class _Ctx:
     """单次消息处理的上下文束，字段可变。"""
 
@@ -2,11 +2,27 @@
 
 from __future__ import annotations
 
+import functools
+import re
+
 from loguru import logger
 
 from ._types import _Ctx
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_wake_keywords(keywords: tuple[str, ...]) -> re.Pattern[str] | None:
+    """把唤醒词列表编译为单个交替正则，一次扫描代替逐词 ``in`` 检查。
+
+    以关键词元组为键缓存，配置热重载后自然命中新条目。
+    """
+    if not keywords:
+        return None
+    # 长词优先，避免短词抢先匹配导致日志中记录的关键词不准确
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, ordered)))
+
+
 class _WakeMixin:
     def _check_wake(
         self, ctx: _Ctx, text: str, is_group: bool
@@ -35,10 +51,13 @@ class _WakeMixin:
 
         keywords_raw = ctx.config.get("wake_keywords")
         if isinstance(keywords_raw, list):
-            for kw in keywords_raw:
-                if isinstance(kw, str) and kw and kw in text:
-                    logger.debug("llm: woken by keyword {!r}", kw)
-                    return text, True
+            pattern = _compile_wake_keywords(
+                tuple(kw for kw in keywords_raw if isinstance(kw, str) and kw)
+            )
+            match = pattern.search(text) if pattern is not None else None
+            if match is not None:
+                logger.debug("llm: woken by keyword {!r}", match.group(0))
+                return text, True
 
         return text, False
 
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from loguru import logger
@@ -171,7 +172,7 @@ class LLMHandler(
             await ctx.reply("[ERR:permission_denied] 无权访问该 Provider。")
             return
         except Exception as exc:
-            logger.error("llm: provider call failed: {}", exc)
+            logger.opt(exception=exc).error("llm: provider call failed: {}", exc)
             await ctx.reply(f"[ERR:{type(exc).__name__}] 请求失败，请稍后再试。")
             return
 
@@ -190,7 +191,7 @@ class LLMHandler(
                 try:
                     retry_result = await self._run_tool_loop(ctx, invoke_kwargs)
                 except Exception as exc2:
-                    logger.error("llm: retry failed: {}", exc2)
+                    logger.opt(exception=exc2).error("llm: retry failed: {}", exc2)
                     return
                 if (
                     isinstance(retry_result, ProviderResponse)
@@ -237,10 +238,11 @@ class LLMHandler(
             invoke_kwargs.get("messages", [])  # type: ignore[arg-type]
         )
 
-        for iteration in range(max_iterations):
-            current_kwargs = dict(invoke_kwargs)
-            current_kwargs["messages"] = messages
+        # messages 在循环中原地追加，调用参数只需构造一次
+        current_kwargs = dict(invoke_kwargs)
+        current_kwargs["messages"] = messages
 
+        for iteration in range(max_iterations):
             result = await self.framework.invoke_provider(**current_kwargs)  # type: ignore[arg-type]
 
             if not isinstance(result, ProviderResponse):
@@ -271,9 +273,12 @@ class LLMHandler(
                 "tool_calls": tool_calls_serialized,
             })
 
-            # 执行所有工具调用，追加结果
-            for tool_call in result.tool_calls:
-                tool_result = await self.framework.tool_registry.dispatch(tool_call)
+            # 同一轮的工具调用互不依赖，并发执行；结果按原顺序追加
+            # （dispatch 内部已捕获工具异常并返回错误 JSON）
+            tool_results = await asyncio.gather(
+                *(self.framework.tool_registry.dispatch(tc) for tc in result.tool_calls)
+            )
+            for tool_call, tool_result in zip(result.tool_calls, tool_results):
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tool_call.id or tool_call.name,
@@ -283,7 +288,5 @@ class LLMHandler(
 
         # 超出最大轮数，做最后一次不带工具的调用
         logger.warning("llm: tool loop reached max iterations ({}), forcing final call", max_iterations)
-        final_kwargs = dict(invoke_kwargs)
-        final_kwargs["messages"] = messages
-        final_kwargs["tools"] = []
-        return await self.framework.invoke_provider(**final_kwargs)  # type: ignore[return-value]
+        current_kwargs["tools"] = []
+        return await self.framework.invoke_provider(**current_kwargs)  # type: ignore[return-value]
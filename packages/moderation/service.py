@@ -7,12 +7,17 @@ from .types import ModerationDecision, ModerationRequest
 class ModerationService:
     def __init__(self) -> None:
         self._backends: dict[str, ModerationBackend] = {}
+        # 写时复制快照：注册时重建，读路径不分配、不受并发注册影响
+        self._ordered: tuple[ModerationBackend, ...] = ()
+        self._names: tuple[str, ...] = ()
 
     def register_backend(self, backend: ModerationBackend) -> None:
         self._backends[backend.name] = backend
+        self._ordered = tuple(self._backends.values())
+        self._names = tuple(sorted(self._backends))
 
     def list_backends(self) -> tuple[str, ...]:
-        return tuple(sorted(self._backends.keys()))
+        return self._names
 
     async def review(
         self,
@@ -25,7 +30,7 @@ class ModerationService:
                 raise KeyError(f"moderation backend not found: {preferred_backend}")
             return await backend.review(request)
 
-        for backend in self._backends.values():
+        for backend in self._ordered:
             decision = await backend.review(request)
             if not decision.allowed or decision.rewritten_text is not None:
                 return decision
@@ -19,7 +19,7 @@ class PermissionEngine:
         if not permissions:
             return PermissionDecision(allowed=True, reason="no permissions requested")
 
-        subject_roles = set(context.subject.all_roles)
+        subject_roles = frozenset(context.subject.all_roles)
         if "owner" in subject_roles or "super_admin" in subject_roles:
             return PermissionDecision(allowed=True, reason="bypassed by elevated role")
 
@@ -27,10 +27,10 @@ class PermissionEngine:
         allowed_permissions: set[str] = set()
 
         for rule in self._rules:
-            if not rule.matches_context(context):
+            if not rule.matches_context(context, subject_roles):
                 continue
 
-            overlap = set(rule.permissions).intersection(permissions)
+            overlap = rule.permission_set.intersection(permissions)
             if not overlap and rule.permissions:
                 continue
 
@@ -50,8 +50,27 @@ class PermissionRule:
     allow: bool = True
     require_all: bool = True
     description: str = ""
+    # 构造时转成集合，evaluate 逐条匹配时不再为每条规则重复建 set
+    _role_set: frozenset[str] = field(
+        init=False, repr=False, compare=False, default=frozenset()
+    )
+    _permission_set: frozenset[str] = field(
+        init=False, repr=False, compare=False, default=frozenset()
+    )
 
-    def matches_context(self, context: AuthorizationContext) -> bool:
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_role_set", frozenset(self.roles))
+        object.__setattr__(self, "_permission_set", frozenset(self.permissions))
+
+    @property
+    def permission_set(self) -> frozenset[str]:
+        return self._permission_set
+
+    def matches_context(
+        self,
+        context: AuthorizationContext,
+        subject_roles: frozenset[str] | None = None,
+    ) -> bool:
         if self.scopes and context.scope not in self.scopes:
             return False
         if self.resource_kinds and context.resource.kind not in self.resource_kinds:
@@ -61,11 +80,11 @@ class PermissionRule:
         if self.platforms and context.platform not in self.platforms:
             return False
         if self.roles:
-            subject_roles = set(context.subject.all_roles)
-            rule_roles = set(self.roles)
-            if self.require_all and not rule_roles.issubset(subject_roles):
+            if subject_roles is None:
+                subject_roles = frozenset(context.subject.all_roles)
+            if self.require_all and not self._role_set <= subject_roles:
                 return False
-            if not self.require_all and rule_roles.isdisjoint(subject_roles):
+            if not self.require_all and self._role_set.isdisjoint(subject_roles):
                 return False
         return True
 
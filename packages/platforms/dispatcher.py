@@ -139,6 +139,13 @@ class BaseDispatcher(ABC):
             plugin_class = cast(type[BasePlugin], registered.plugin_class)
             return plugin_class(ctx, schema_registry=self.framework.schema_registry)
 
+        def _overrides_on_event(plugin_name: str) -> bool:
+            # 未覆盖 BasePlugin.on_event（空实现）的插件无需构建上下文和实例
+            registered = self.framework.runtime_registry.plugins.get(plugin_name)
+            if registered is None:
+                return True
+            return getattr(registered.plugin_class, "on_event", None) is not BasePlugin.on_event
+
         # --- Command routing: O(1) ---
         cmd_prefix = self._resolve_command_prefix(cfg)
         plain_text = (event.plain_text or "").strip()
@@ -172,7 +179,7 @@ class BaseDispatcher(ABC):
                     handled_plugins.add(plugin_name)
                     command_handled = True
                 except Exception as exc:
-                    logger.error(
+                    logger.opt(exception=exc).error(
                         "[{}] 插件 {!r} 命令处理异常 (cmd={}): {}",
                         event.platform, plugin_name, cmd_name, exc,
                     )
@@ -202,9 +209,10 @@ class BaseDispatcher(ABC):
                             await cast(
                                 Callable[[dict[str, object]], Awaitable[None]], handler
                             )(payload)
-                    await plugin.on_event(event.event_name, payload)
+                    if _overrides_on_event(plugin_name):
+                        await plugin.on_event(event.event_name, payload)
                 except Exception as exc:
-                    logger.error(
+                    logger.opt(exception=exc).error(
                         "[{}] 插件 {!r} 事件处理异常 (event={}): {}",
                         event.platform, plugin_name, event.event_name, exc,
                     )
@@ -212,14 +220,14 @@ class BaseDispatcher(ABC):
 
             # --- on_event fallback for remaining enabled plugins ---
             for plugin_name in enabled:
-                if plugin_name in handled_plugins:
+                if plugin_name in handled_plugins or not _overrides_on_event(plugin_name):
                     continue
                 try:
                     ctx = await _build_ctx(plugin_name)
                     plugin = _instantiate(plugin_name, ctx)
                     await plugin.on_event(event.event_name, payload)
                 except Exception as exc:
-                    logger.error(
+                    logger.opt(exception=exc).error(
                         "[{}] 插件 {!r} on_event 异常: {}",
                         event.platform, plugin_name, exc,
                     )
@@ -238,7 +246,7 @@ class BaseDispatcher(ABC):
                     recall=recall_callable,
                 )
             except Exception as exc:
-                logger.error("[{}] LLM handler 异常: {}", event.platform, exc)
+                logger.opt(exception=exc).error("[{}] LLM handler 异常: {}", event.platform, exc)
 
         return contexts
 
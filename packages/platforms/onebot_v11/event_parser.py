@@ -18,6 +18,32 @@ from .types import (
     ValueMap,
 )
 
+# 模块加载时预先计算的映射，避免每条消息重复构建 / 逐个比较
+# data 原样保留的 OB11 segment type → 通用 SegmentType
+_PASSTHROUGH_SEGMENT_TYPES: dict[str, str] = {
+    OneBotV11SegmentType.TEXT: SegmentType.TEXT,
+    OneBotV11SegmentType.IMAGE: SegmentType.IMAGE,
+    OneBotV11SegmentType.RECORD: SegmentType.VOICE,
+    OneBotV11SegmentType.VIDEO: SegmentType.VIDEO,
+    OneBotV11SegmentType.FACE: SegmentType.STICKER,
+    "mface": SegmentType.STICKER,
+    OneBotV11SegmentType.FORWARD: SegmentType.FORWARD,
+    "poke": SegmentType.POKE,
+    "location": SegmentType.LOCATION,
+}
+
+_SEGMENT_LABELS: dict[str, str] = {
+    SegmentType.IMAGE: "[图片]",
+    SegmentType.VIDEO: "[视频]",
+    SegmentType.VOICE: "[语音]",
+    SegmentType.FILE: "[文件]",
+    SegmentType.STICKER: "[表情]",
+    SegmentType.FORWARD: "[合并转发]",
+    SegmentType.CARD: "[卡片]",
+    SegmentType.POKE: "[戳一戳]",
+    SegmentType.LOCATION: "[位置]",
+}
+
 
 class OneBotV11EventParser:
     """Parse raw OneBot V11 JSON payloads into platform-agnostic PlatformEvent."""
@@ -208,8 +234,9 @@ class OneBotV11EventParser:
 
     def _normalize_segment(self, ob11_type: str, data: ValueMap) -> MessageSegment:
         """Map an OB11 wire-format segment to a platform-agnostic MessageSegment."""
-        if ob11_type == OneBotV11SegmentType.TEXT:
-            return MessageSegment(type=SegmentType.TEXT, data=data)
+        mapped = _PASSTHROUGH_SEGMENT_TYPES.get(ob11_type)
+        if mapped is not None:
+            return MessageSegment(type=mapped, data=data)
 
         if ob11_type == OneBotV11SegmentType.AT:
             # OB11 uses "qq" for user_id; normalise to "user_id"
@@ -221,33 +248,9 @@ class OneBotV11EventParser:
             msg_id = self._string(data.get("id")) or ""
             return MessageSegment(type=SegmentType.REPLY, data={"message_id": msg_id})
 
-        if ob11_type == OneBotV11SegmentType.IMAGE:
-            return MessageSegment(type=SegmentType.IMAGE, data=data)
-
-        if ob11_type == OneBotV11SegmentType.RECORD:
-            return MessageSegment(type=SegmentType.VOICE, data=data)
-
-        if ob11_type == OneBotV11SegmentType.VIDEO:
-            return MessageSegment(type=SegmentType.VIDEO, data=data)
-
-        if ob11_type == OneBotV11SegmentType.FACE:
-            return MessageSegment(type=SegmentType.STICKER, data=data)
-
-        if ob11_type == "mface":
-            return MessageSegment(type=SegmentType.STICKER, data=data)
-
-        if ob11_type == OneBotV11SegmentType.FORWARD:
-            return MessageSegment(type=SegmentType.FORWARD, data=data)
-
         if ob11_type in (OneBotV11SegmentType.JSON, OneBotV11SegmentType.XML):
             return MessageSegment(type=SegmentType.CARD, data={**data, "card_type": ob11_type})
 
-        if ob11_type == "poke":
-            return MessageSegment(type=SegmentType.POKE, data=data)
-
-        if ob11_type == "location":
-            return MessageSegment(type=SegmentType.LOCATION, data=data)
-
         # Unknown / unhandled — preserve original type for platform-specific use
         return MessageSegment(type=SegmentType.UNKNOWN, data={**data, "original_type": ob11_type})
 
@@ -276,17 +279,6 @@ class OneBotV11EventParser:
         return "".join(text_parts).strip() or None
 
     def _describe_segments(self, segments: list[MessageSegment]) -> str:
-        _LABELS: dict[str, str] = {
-            SegmentType.IMAGE: "[图片]",
-            SegmentType.VIDEO: "[视频]",
-            SegmentType.VOICE: "[语音]",
-            SegmentType.FILE: "[文件]",
-            SegmentType.STICKER: "[表情]",
-            SegmentType.FORWARD: "[合并转发]",
-            SegmentType.CARD: "[卡片]",
-            SegmentType.POKE: "[戳一戳]",
-            SegmentType.LOCATION: "[位置]",
-        }
         parts: list[str] = []
         for seg in segments:
             if seg.type == SegmentType.TEXT:
@@ -300,7 +292,7 @@ class OneBotV11EventParser:
                 uid = seg.data.get("user_id", "")
                 parts.append(f"[@{uid}]")
             else:
-                parts.append(_LABELS.get(seg.type, f"[{seg.type}]"))
+                parts.append(_SEGMENT_LABELS.get(seg.type, f"[{seg.type}]"))
         return " ".join(parts) if parts else "[空消息]"
 
     # ------------------------------------------------------------------
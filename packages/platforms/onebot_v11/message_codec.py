@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import cast
 
 from .types import OneBotV11MessageSegment, OneBotV11SegmentType, ValueMap
@@ -74,29 +75,9 @@ class OneBotV11MessageCodec:
     def _encode_segment(
         self, segment: OneBotV11MessageSegment
     ) -> dict[str, object] | None:
-        if segment.type == OneBotV11SegmentType.TEXT:
-            text = segment.data.get("text")
-            if isinstance(text, str) and text.strip():
-                return {"type": "text", "data": {"text": text}}
-            return None
-
-        if segment.type == OneBotV11SegmentType.AT:
-            qq = segment.data.get("qq") or segment.data.get("user_id")
-            if isinstance(qq, str):
-                return {"type": "at", "data": {"qq": qq}}
-            return None
-
-        if segment.type == OneBotV11SegmentType.REPLY:
-            message_id = segment.data.get("id") or segment.data.get("message_id")
-            if isinstance(message_id, str):
-                return {"type": "reply", "data": {"id": message_id}}
-            return None
-
-        if segment.type == OneBotV11SegmentType.IMAGE:
-            file = segment.data.get("file")
-            if isinstance(file, str) and file:
-                return {"type": "image", "data": {"file": file}}
-            return None
+        encoder = _SEGMENT_ENCODERS.get(segment.type)
+        if encoder is not None:
+            return encoder(segment.data)
 
         if segment.type and segment.type != OneBotV11SegmentType.UNKNOWN:
             return {"type": segment.type, "data": dict(segment.data)}
@@ -108,3 +89,40 @@ class OneBotV11MessageCodec:
             return {}
         raw = cast(dict[object, object], value)
         return {str(key): item for key, item in raw.items() if isinstance(key, str)}
+
+
+def _encode_text(data: ValueMap) -> dict[str, object] | None:
+    text = data.get("text")
+    if isinstance(text, str) and text.strip():
+        return {"type": "text", "data": {"text": text}}
+    return None
+
+
+def _encode_at(data: ValueMap) -> dict[str, object] | None:
+    qq = data.get("qq") or data.get("user_id")
+    if isinstance(qq, str):
+        return {"type": "at", "data": {"qq": qq}}
+    return None
+
+
+def _encode_reply(data: ValueMap) -> dict[str, object] | None:
+    message_id = data.get("id") or data.get("message_id")
+    if isinstance(message_id, str):
+        return {"type": "reply", "data": {"id": message_id}}
+    return None
+
+
+def _encode_image(data: ValueMap) -> dict[str, object] | None:
+    file = data.get("file")
+    if isinstance(file, str) and file:
+        return {"type": "image", "data": {"file": file}}
+    return None
+
+
+# segment type → 编码函数；一次字典查找代替逐个比较的 if 链
+_SEGMENT_ENCODERS: dict[str, Callable[[ValueMap], dict[str, object] | None]] = {
+    OneBotV11SegmentType.TEXT: _encode_text,
+    OneBotV11SegmentType.AT: _encode_at,
+    OneBotV11SegmentType.REPLY: _encode_reply,
+    OneBotV11SegmentType.IMAGE: _encode_image,
+}
@@ -171,7 +171,7 @@ class OneBotV11Transport:
         # asyncio.create_task copies the current contextvars context, so quart_ws
         # inside drain() resolves to this connection's WebSocket object.
         async def _send_fn(data: dict[str, object]) -> None:
-            await quart_ws.send(json.dumps(data))
+            await quart_ws.send(json.dumps(data, ensure_ascii=False, separators=(",", ":")))
 
         client = _ClientConnection(_send_fn)
         self._clients.append(client)
@@ -207,11 +207,8 @@ class OneBotV11Transport:
         raw = cast(object, json.loads(payload))
         if not isinstance(raw, dict):
             return
-        data = {
-            str(key): value
-            for key, value in cast(dict[object, object], raw).items()
-            if isinstance(key, str)
-        }
+        # JSON 对象的键必然是字符串，直接使用解析结果，无需逐键复制
+        data = cast(dict[str, object], raw)
 
         if self._is_action_response(data):
             logger.debug("OneBot action response received: echo={}", data.get("echo"))
@@ -221,8 +218,8 @@ class OneBotV11Transport:
         if self.raw_event_handler is not None:
             logger.debug(
                 (
-                    "OneBot event payload received: post_type=%s message_type=%s "
-                    "notice_type=%s request_type=%s meta_event_type=%s"
+                    "OneBot event payload received: post_type={} message_type={} "
+                    "notice_type={} request_type={} meta_event_type={}"
                 ),
                 data.get("post_type"),
                 data.get("message_type"),
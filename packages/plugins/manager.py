@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import shutil
 import sys
 import tempfile
@@ -23,6 +24,15 @@ _GITHUB_PROXIES = [
 ]
 
 
+async def _remove_tree(path: Path, *, ignore_errors: bool = False) -> None:
+    """在线程池中删除目录树。
+
+    rmtree 是纯 syscall 工作（unlink/rmdir 期间释放 GIL），直接在协程里调用
+    会在删除较大的插件目录时阻塞事件循环。
+    """
+    await asyncio.to_thread(shutil.rmtree, path, ignore_errors=ignore_errors)
+
+
 class PluginManager:
     """插件生命周期管理：安装、卸载、更新、列表。
 
@@ -91,13 +101,13 @@ class PluginManager:
 
         if not (plugin_dir / "__init__.py").exists():
             logger.error("PluginManager: {} has no __init__.py, not a valid plugin", plugin_dir.name)
-            shutil.rmtree(plugin_dir, ignore_errors=True)
+            await _remove_tree(plugin_dir, ignore_errors=True)
             return False
 
         dep_ok = await install_plugin_dependencies(plugin_dir)
         if not dep_ok:
             logger.error("PluginManager: dependency install failed for {}, rolling back", plugin_dir.name)
-            shutil.rmtree(plugin_dir, ignore_errors=True)
+            await _remove_tree(plugin_dir, ignore_errors=True)
             return False
 
         parent = str(self.plugin_dir.parent)
@@ -109,7 +119,7 @@ class PluginManager:
             names = self.reloader.load(module_path)
         except Exception as exc:
             logger.error("PluginManager: load failed for {}: {}", plugin_dir.name, exc)
-            shutil.rmtree(plugin_dir, ignore_errors=True)
+            await _remove_tree(plugin_dir, ignore_errors=True)
             return False
 
         meta = load_plugin_metadata(plugin_dir)
@@ -132,7 +142,7 @@ class PluginManager:
             dir_name = module_path.split(".")[-1]
             target = self.plugin_dir / dir_name
             if target.exists():
-                shutil.rmtree(target)
+                await _remove_tree(target)
                 logger.info("PluginManager: removed {}", target)
 
         logger.info("PluginManager: uninstalled {!r}", plugin_name)
@@ -156,7 +166,7 @@ class PluginManager:
         # 卸载但保留文件，稍后覆盖
         self.reloader.unload(module_path)
         if target.exists():
-            shutil.rmtree(target)
+            await _remove_tree(target)
 
         return await self.install(meta.repository, dir_name=dir_name, use_proxy=use_proxy, proxy=proxy)
 
@@ -283,7 +293,7 @@ class PluginManager:
 
         if target.exists():
             logger.warning("PluginManager: {} already exists, overwriting", dir_name)
-            shutil.rmtree(target)
+            await _remove_tree(target)
 
         try:
             with zipfile.ZipFile(zip_path, "r") as zf:
@@ -302,5 +312,5 @@ class PluginManager:
             return target
         except Exception as exc:
             logger.error("PluginManager: extraction failed: {}", exc)
-            shutil.rmtree(target, ignore_errors=True)
+            await _remove_tree(target, ignore_errors=True)
             return None
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import cast
+from collections.abc import Callable
+from typing import TypeVar, cast
 
 from ..contracts import ProviderSpec
 from ..decorators.core import PROVIDER_SPEC_ATTR
@@ -16,11 +17,14 @@ from .types import (
     RerankResponse,
     STTRequest,
     STTResponse,
+    ToolDefinition,
     TTSRequest,
     TTSResponse,
     ValueMap,
 )
 
+_T = TypeVar("_T")
+
 
 class BaseProvider(ABC):
     def __init__(
@@ -107,10 +111,30 @@ class BaseProvider(ABC):
 
 
 class ChatProvider(BaseProvider, ABC):
+    # 上一次请求的工具列表及其 SDK 载荷；ToolRegistry 在工具集不变时复用同一批
+    # ToolDefinition 对象，按身份比较即可跳过逐个工具的载荷构建
+    _tool_payload_memo: tuple[tuple[ToolDefinition, ...], list[object]] | None = None
+
     @abstractmethod
     async def generate(self, request: ProviderRequest) -> ProviderResponse:
         raise NotImplementedError
 
+    def _memoized_tool_payloads(
+        self,
+        tools: list[ToolDefinition],
+        build: Callable[[list[ToolDefinition]], list[_T]],
+    ) -> list[_T]:
+        memo = self._tool_payload_memo
+        if memo is not None:
+            previous, payloads = memo
+            if len(previous) == len(tools) and all(
+                a is b for a, b in zip(previous, tools)
+            ):
+                return cast(list[_T], list(payloads))
+        built = build(tools)
+        self._tool_payload_memo = (tuple(tools), cast(list[object], built))
+        return list(built)
+
 
 class EmbeddingProvider(BaseProvider, ABC):
     @abstractmethod
@@ -47,9 +47,9 @@ class ProviderRegistry:
             raise KeyError(f"provider not registered: {provider_name}") from exc
 
     async def get(self, provider_name: str) -> BaseProvider:
-        # Fast path: already initialised
-        if provider_name in self._instances:
-            instance = self._instances[provider_name]
+        # Fast path: already initialised — single dict probe on the per-request path
+        instance = self._instances.get(provider_name)
+        if instance is not None:
             await instance.ensure_setup()
             return instance
 
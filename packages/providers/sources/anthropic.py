@@ -110,13 +110,19 @@ class AnthropicChatProvider(ChatProvider):
                 cast(MessageParam, {"role": "user", "content": content})
             )
 
+        # 最后一条 user 消息的下标（逆序扫描一次，而非对每条消息切片检查）
+        last_user_idx = next(
+            (i for i in range(len(request.messages) - 1, -1, -1) if request.messages[i].role == "user"),
+            -1,
+        )
+
         # 处理历史消息
         for idx, message in enumerate(request.messages):
             role = message.role
             content: str | list[dict[str, object]] = message.content
             
             # 如果是最后一条 user 消息且有 image_urls
-            is_last_user = (role == "user" and not any(m.role == "user" for m in request.messages[idx+1:]))
+            is_last_user = idx == last_user_idx
             if is_last_user and request.image_urls and not request.prompt:
                 content = await self._build_multimodal_content(message.content, request.image_urls)
 
@@ -312,6 +318,9 @@ class AnthropicChatProvider(ChatProvider):
         return 1024
 
     def _build_tools(self, tools: list[ToolDefinition]) -> list[ToolUnionParam]:
+        return self._memoized_tool_payloads(tools, self._convert_tools)
+
+    def _convert_tools(self, tools: list[ToolDefinition]) -> list[ToolUnionParam]:
         payloads: list[ToolUnionParam] = []
         for tool in tools:
             payloads.append(
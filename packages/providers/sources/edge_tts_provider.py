@@ -73,9 +73,11 @@ class EdgeTTSProvider(TTSProvider):
         try:
             communicate = edge_tts.Communicate(text, voice)
             buf = io.BytesIO()
+            # 逐块循环中预先绑定方法，避免每个分片重复属性查找
+            write = buf.write
             async for chunk in communicate.stream():
                 if chunk["type"] == "audio":
-                    buf.write(chunk["data"])
+                    write(chunk["data"])
             audio_bytes = buf.getvalue()
             if not audio_bytes:
                 return TTSResponse(
@@ -192,6 +192,12 @@ class GeminiChatProvider(ChatProvider):
             initial_parts = [types.Part(text=request.prompt)]
             add_parts("user", initial_parts)
 
+        # 最后一条 user 消息的下标（逆序扫描一次，而非对每条消息切片检查）
+        last_user_idx = next(
+            (i for i in range(len(request.messages) - 1, -1, -1) if request.messages[i].role == "user"),
+            -1,
+        )
+
         # 处理历史消息
         for idx, message in enumerate(request.messages):
             role = message.role
@@ -232,7 +238,7 @@ class GeminiChatProvider(ChatProvider):
                 # User messages
                 user_parts = [types.Part(text=content)]
                 # 如果是最后一条 user 消息且有 image_urls
-                is_last_user = (role == "user" and not any(m.role == "user" for m in request.messages[idx+1:]))
+                is_last_user = idx == last_user_idx
                 if is_last_user and request.image_urls and not request.prompt:
                     for url in request.image_urls:
                         if url.startswith("data:"):
@@ -266,6 +272,9 @@ class GeminiChatProvider(ChatProvider):
     def _build_tools(self, tools: list[ToolDefinition]) -> list[types.Tool]:
         if not tools:
             return []
+        return self._memoized_tool_payloads(tools, self._convert_tools)
+
+    def _convert_tools(self, tools: list[ToolDefinition]) -> list[types.Tool]:
         declarations = [
             types.FunctionDeclaration(
                 name=tool.name,
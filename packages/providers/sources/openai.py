@@ -417,6 +417,11 @@ class OpenAIChatProvider(ChatProvider):
 
     def _build_tools(
         self, tools: list[ToolDefinition]
+    ) -> list[ChatCompletionToolUnionParam]:
+        return self._memoized_tool_payloads(tools, self._convert_tools)
+
+    def _convert_tools(
+        self, tools: list[ToolDefinition]
     ) -> list[ChatCompletionToolUnionParam]:
         payloads: list[ChatCompletionToolUnionParam] = []
         for tool in tools:
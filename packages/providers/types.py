@@ -64,7 +64,7 @@ class ChatMessage:
     metadata: ValueMap = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolDefinition:
     name: str
     description: str = ""
@@ -72,7 +72,7 @@ class ToolDefinition:
     metadata: ValueMap = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolCall:
     id: str | None = None
     name: str = ""
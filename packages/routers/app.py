@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import importlib
 import os
 import pkgutil
+import time
 from pathlib import Path
 
+from loguru import logger
 from quart import Blueprint, Quart, Response, request, send_file
+from werkzeug.exceptions import HTTPException
 
+from .. import __version__
 from ..app import NekoBotFramework
 from . import routes
 
@@ -31,14 +36,22 @@ def _allowed_origins() -> frozenset[str]:
 
 
 _CORS_ORIGINS: frozenset[str] = _allowed_origins()
+_CORS_ANY: bool = "*" in _CORS_ORIGINS
+_CORS_ALLOW_METHODS = "GET, POST, OPTIONS, PUT, DELETE"
+_CORS_ALLOW_HEADERS = "Content-Type, Authorization"
+_NOT_FOUND_BODY = '{"success":false,"message":"Not found"}'
 
 
 def create_app(framework: NekoBotFramework) -> Quart:
     """创建并配置 Quart 实例，接入核心框架依赖。"""
     app = Quart(__name__)
+    # 默认 JSON provider 每次响应都对键排序并转义非 ASCII 字符；
+    # 两者关闭后序列化更快、中文消息体积更小
+    app.json.sort_keys = False  # type: ignore[attr-defined]
+    app.json.ensure_ascii = False  # type: ignore[attr-defined]
 
     def _cors_origin(origin: str) -> str | None:
-        if "*" in _CORS_ORIGINS:
+        if _CORS_ANY:
             return "*"
         return origin if origin in _CORS_ORIGINS else None
 
@@ -48,12 +61,19 @@ def create_app(framework: NekoBotFramework) -> Quart:
         allowed = _cors_origin(origin)
         if allowed:
             response.headers["Access-Control-Allow-Origin"] = allowed
-            response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS, PUT, DELETE"
-            response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
+            response.headers["Access-Control-Allow-Methods"] = _CORS_ALLOW_METHODS
+            response.headers["Access-Control-Allow-Headers"] = _CORS_ALLOW_HEADERS
             if allowed != "*":
                 response.headers["Vary"] = "Origin"
         return response
 
+    @app.errorhandler(HTTPException)
+    async def api_http_error(exc: HTTPException) -> tuple[dict[str, object], int] | HTTPException:
+        # API 路径统一返回 JSON 信封（如 get_json 解析失败的 400），其余路径保持默认页面
+        if not request.path.startswith("/api/"):
+            return exc
+        return {"success": False, "message": exc.description or exc.name}, exc.code or 500
+
     @app.route("/", defaults={"path": ""}, methods=["OPTIONS"])
     @app.route("/<path:path>", methods=["OPTIONS"])
     async def cors_preflight(path: str) -> Response:
@@ -63,59 +83,84 @@ def create_app(framework: NekoBotFramework) -> Quart:
             return Response("", status=403)
         return Response("", status=204, headers={
             "Access-Control-Allow-Origin": allowed,
-            "Access-Control-Allow-Methods": "GET, POST, OPTIONS, PUT, DELETE",
-            "Access-Control-Allow-Headers": "Content-Type, Authorization",
+            "Access-Control-Allow-Methods": _CORS_ALLOW_METHODS,
+            "Access-Control-Allow-Headers": _CORS_ALLOW_HEADERS,
             "Vary": "Origin",
         })
 
     # 注入框架实例
     app.config["FRAMEWORK"] = framework
     app.config["START_TIME"] = datetime.datetime.now(datetime.timezone.utc)
+    # 运行时长基于单调时钟，不受系统时间调整影响
+    app.config["START_MONOTONIC"] = time.monotonic()
 
     # 动态注册路由组
     _discover_and_register_routes(app, routes)
 
     @app.route("/api/v1/ping", methods=["GET"])
     async def ping() -> dict[str, object]:
-        try:
-            from importlib.metadata import version as _pkg_version
-            _version = _pkg_version("nekobot")
-        except Exception:
-            _version = "unknown"
-        return {"success": True, "message": "pong", "version": _version}
+        # 版本号在包导入时已解析，不再每次请求扫描已安装发行包的元数据
+        return {"success": True, "message": "pong", "version": __version__}
 
     # 静态文件 + SPA fallback（仅当 dist 目录存在时生效）
     # 优先取环境变量，否则相对于当前工作目录（通常是项目根目录）
     _dist_raw = os.environ.get("NEKOBOT_DIST_DIR", "data/dist")
     _dist = Path(_dist_raw) if os.path.isabs(_dist_raw) else (Path.cwd() / _dist_raw)
     _dist = _dist.resolve()
-    from loguru import logger as _log
     if not _dist.is_dir():
-        _log.warning("WebUI dist 目录不存在，静态文件服务已跳过: {}", _dist)
+        logger.warning("WebUI dist 目录不存在，静态文件服务已跳过: {}", _dist)
     else:
         _index = _dist / "index.html"
-        _log.info("Serving WebUI from: {}", _dist)
+        # dist 内容只随部署变化，index.html 是否存在在启动时判断一次
+        _has_index = _index.is_file()
+        # 静态文件清单在启动时扫描一次：请求时只做集合查找，不再逐个 stat；
+        # 清单之外（含 ".." 等穿越写法）的路径一律回退到 index.html
+        _static_files = _scan_static_files(_dist)
+        # SPA 深链接每次都回退到 index.html：启动时读入内存并计算 ETag，支持 304
+        _index_bytes = _index.read_bytes() if _has_index else b""
+        _index_etag = hashlib.blake2b(_index_bytes, digest_size=16).hexdigest()
+        if _has_index:
+            logger.info("Serving WebUI from: {}", _dist)
+        else:
+            logger.warning("WebUI dist 目录缺少 index.html，SPA 回退将返回 404: {}", _dist)
+
+        async def _send_index() -> Response:
+            if not _has_index:
+                return Response(_NOT_FOUND_BODY, status=404, content_type="application/json")
+            if request.if_none_match.contains(_index_etag):
+                response = Response(b"", status=304)
+            else:
+                response = Response(_index_bytes, content_type="text/html; charset=utf-8")
+            response.set_etag(_index_etag)
+            response.headers["Cache-Control"] = "no-cache"
+            return response
 
         @app.route("/")
         async def _root() -> Response:
-            return await send_file(_index)
+            return await _send_index()
 
         @app.route("/<path:path>", methods=["GET"])
         async def _static_or_spa(path: str) -> Response:
             # API 路径不应到达此处，但防止意外匹配
             if path.startswith("api/"):
-                return Response('{"success":false,"message":"Not found"}', status=404, content_type="application/json")
-            candidate = _dist / path
-            try:
-                candidate.relative_to(_dist)  # 防止路径穿越
-            except ValueError:
-                return await send_file(_index)
-            if candidate.is_file():
-                return await send_file(candidate)
-            return await send_file(_index)
+                return Response(_NOT_FOUND_BODY, status=404, content_type="application/json")
+            if path in _static_files:
+                return await send_file(_dist / path)
+            return await _send_index()
 
     return app
 
+
+def _scan_static_files(root: Path) -> frozenset[str]:
+    """返回 root 下全部文件的相对路径（POSIX 分隔符），用于静态资源白名单。"""
+    files: set[str] = set()
+    for dirpath, _dirnames, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        prefix = "" if rel_dir == "." else f"{rel_dir}/"
+        files.update(prefix + name for name in filenames)
+    return frozenset(files)
+
+
 def _discover_and_register_routes(app: Quart, routes_pkg: object) -> None:
     """自动扫描并注册指定包下的所有 Blueprint。"""
     pkg_path = getattr(routes_pkg, "__path__", None)
@@ -129,15 +174,14 @@ def _discover_and_register_routes(app: Quart, routes_pkg: object) -> None:
         full_module_name = f"{routes_pkg.__name__}.{name}"
         try:
             module = importlib.import_module(full_module_name)
-            # 搜索模块中的 Blueprint 实例
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
+            # 搜索模块中的 Blueprint 实例：直接遍历模块命名空间（定义顺序），
+            # 无需 dir() 排序后再逐个 getattr
+            for attr in list(vars(module).values()):
                 if isinstance(attr, Blueprint):
                     # 默认使用 /api/{bp_name} 作为路由前缀，除非 bp 已经自带前缀
                     # or conventionally use url_prefix defined in bp
                     url_prefix = getattr(attr, "url_prefix", None) or f"/api/{attr.name}"
                     app.register_blueprint(attr, url_prefix=url_prefix)
-                    # logger.info(f"Registered blueprint: {attr.name} from {full_module_name}")
-        except Exception:
-            # logger.error(f"Failed to load route module {full_module_name}: {e}")
-            pass
+                    logger.debug("Registered blueprint: {} from {}", attr.name, full_module_name)
+        except Exception as exc:
+            logger.opt(exception=exc).error("Failed to load route module {}: {}", full_module_name, exc)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import secrets
+import asyncio
 from pathlib import Path
 
 import aiosqlite
@@ -11,9 +11,27 @@ _DEFAULT_USERNAME = "nekobot"
 _DEFAULT_PASSWORD = "nekobot"
 _JWT_SECRET_FILE = Path("data/jwt_secret.key")
 
+
+def _bcrypt_rounds() -> int:
+    """bcrypt 成本因子，可由 NEKOBOT_BCRYPT_ROUNDS 调整（4–31，默认 12）。"""
+    import os
+
+    raw = os.environ.get("NEKOBOT_BCRYPT_ROUNDS", "").strip()
+    try:
+        rounds = int(raw) if raw else 12
+    except ValueError:
+        return 12
+    return rounds if 4 <= rounds <= 31 else 12
+
+
+# 只影响新生成的哈希；已存储的哈希自带成本因子，校验不受影响
+_BCRYPT_ROUNDS = _bcrypt_rounds()
+
 # Module-level persistent connection and init flag
 _conn: aiosqlite.Connection | None = None
 _initialized: bool = False
+# 串行化首次初始化：种子用户的 bcrypt 哈希耗时较长，并发首次登录否则会重复 INSERT
+_init_lock = asyncio.Lock()
 
 
 def load_jwt_secret() -> str:
@@ -25,12 +43,20 @@ def load_jwt_secret() -> str:
         return env_secret
     if _JWT_SECRET_FILE.exists():
         return _JWT_SECRET_FILE.read_text().strip()
+    # 仅首次启动生成密钥时才需要
+    import secrets
+
     secret = secrets.token_hex(32)
     _JWT_SECRET_FILE.parent.mkdir(parents=True, exist_ok=True)
     _JWT_SECRET_FILE.write_text(secret)
     return secret
 
 
+async def _hash_password(password: str) -> bytes:
+    """在线程中计算 bcrypt 哈希，避免阻塞事件循环。"""
+    return await asyncio.to_thread(bcrypt.hashpw, password.encode(), bcrypt.gensalt(_BCRYPT_ROUNDS))
+
+
 async def _get_conn(db_path: Path = _DEFAULT_DB) -> aiosqlite.Connection:
     global _conn
     if _conn is None:
@@ -42,9 +68,15 @@ async def _get_conn(db_path: Path = _DEFAULT_DB) -> aiosqlite.Connection:
 
 async def init_auth_db(db_path: Path = _DEFAULT_DB) -> None:
     """Create users table and seed default admin. Idempotent — safe to call at startup once."""
-    global _initialized
     if _initialized:
         return
+    async with _init_lock:
+        if not _initialized:
+            await _init_auth_db(db_path)
+
+
+async def _init_auth_db(db_path: Path) -> None:
+    global _initialized
     db = await _get_conn(db_path)
     await db.execute(
         """
@@ -59,7 +91,7 @@ async def init_auth_db(db_path: Path = _DEFAULT_DB) -> None:
         "SELECT 1 FROM users WHERE username = ?", (_DEFAULT_USERNAME,)
     )
     if await cursor.fetchone() is None:
-        hashed = bcrypt.hashpw(_DEFAULT_PASSWORD.encode(), bcrypt.gensalt())
+        hashed = await _hash_password(_DEFAULT_PASSWORD)
         await db.execute(
             "INSERT INTO users (username, password_hash) VALUES (?, ?)",
             (_DEFAULT_USERNAME, hashed),
@@ -78,14 +110,15 @@ async def verify_password(username: str, password: str, db_path: Path = _DEFAULT
     if row is None:
         return False
     stored: bytes = bytes(row["password_hash"])
-    return bcrypt.checkpw(password.encode(), stored)
+    # bcrypt 校验刻意耗时（数百毫秒），放到线程中执行以免阻塞事件循环
+    return await asyncio.to_thread(bcrypt.checkpw, password.encode(), stored)
 
 
 async def update_password(
     username: str, new_password: str, db_path: Path = _DEFAULT_DB
 ) -> None:
     await init_auth_db(db_path)
-    hashed = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+    hashed = await _hash_password(new_password)
     db = await _get_conn(db_path)
     await db.execute(
         "UPDATE users SET password_hash = ? WHERE username = ?",
@@ -95,8 +128,10 @@ async def update_password(
 
 
 async def close_auth_db() -> None:
-    global _conn, _initialized
+    global _conn, _initialized, _init_lock
     if _conn is not None:
         await _conn.close()
         _conn = None
         _initialized = False
+    # 锁在首次争用时绑定事件循环；关闭后换新锁，便于在新的事件循环中重新初始化
+    _init_lock = asyncio.Lock()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import functools
+import time
+from collections import OrderedDict
 from typing import Any, Callable, TypeVar
 
 import jwt
@@ -8,7 +10,12 @@ from quart import g, request
 
 from .auth_store import load_jwt_secret
 
-_JWT_SECRET: str = load_jwt_secret()
+
+@functools.cache
+def jwt_secret() -> str:
+    """签发与校验共用的 JWT 密钥，首次使用时加载（导入本模块不再读写密钥文件）。"""
+    return load_jwt_secret()
+
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -20,12 +27,42 @@ def _bearer_token() -> str | None:
     return None
 
 
+# 已验证 token 的短期缓存：WebUI 轮询会反复携带同一 token，命中时跳过 HMAC 校验。
+# 条目最长保留 _TOKEN_CACHE_TTL 秒，且不晚于 token 自身的 exp。
+_TOKEN_CACHE_MAX = 1024
+_TOKEN_CACHE_TTL = 30.0
+_token_cache: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+# 由 PyJWT 在校验时强制要求的声明：缺少 exp/sub 的 token 直接判为无效，
+# 缓存过期时间与 current_user() 均可放心依赖这两个字段
+_DECODE_OPTIONS = {"require": ["exp", "sub"]}
+
+
 def _decode_token(token: str) -> dict | None:
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        claims, expires_at = cached
+        if now < expires_at:
+            _token_cache.move_to_end(token)
+            return claims
+        del _token_cache[token]
+
     try:
-        return jwt.decode(token, _JWT_SECRET, algorithms=["HS256"])
+        claims = jwt.decode(token, jwt_secret(), algorithms=["HS256"], options=_DECODE_OPTIONS)
     except jwt.PyJWTError:
         return None
 
+    expires_at = min(now + _TOKEN_CACHE_TTL, float(claims["exp"]))
+    _token_cache[token] = (claims, expires_at)
+    if len(_token_cache) > _TOKEN_CACHE_MAX:
+        _token_cache.popitem(last=False)
+    return claims
+
+
+def clear_token_cache() -> None:
+    """清空已验证 token 缓存（轮换密钥或测试时使用）。"""
+    _token_cache.clear()
+
 
 def require_auth(fn: F) -> F:
     """验证 Bearer JWT，通过后将 claims 存入 g.claims；失败返回 401。"""
@@ -5,13 +5,11 @@ import datetime
 import jwt
 from quart import Blueprint, request
 
-from ..auth_store import load_jwt_secret, update_password, verify_password
-from ..deps import current_user, require_auth
+from ..auth_store import update_password, verify_password
+from ..deps import current_user, jwt_secret, require_auth
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/api/v1/auth")
 
-_JWT_SECRET: str = load_jwt_secret()
-
 
 @auth_bp.route("/token", methods=["POST"])
 async def create_token() -> tuple[dict, int] | dict:
@@ -37,7 +35,7 @@ async def create_token() -> tuple[dict, int] | dict:
             "exp": now + datetime.timedelta(days=7),
             "role": "admin",
         },
-        _JWT_SECRET,
+        jwt_secret(),
         algorithm="HS256",
     )
     return {
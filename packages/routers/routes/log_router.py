@@ -33,18 +33,27 @@ def _safe_log_path(filename: str) -> Path | None:
 @log_bp.route("", methods=["GET"], strict_slashes=False)
 @require_auth
 async def list_logs() -> tuple[dict, int] | dict:
-    if not _LOG_DIR.exists():
-        return {"success": True, "data": []}
-    files = []
-    for entry in sorted(_LOG_DIR.iterdir()):
-        if entry.is_file():
-            stat = entry.stat()
-            files.append({
-                "name": entry.name,
-                "size_bytes": stat.st_size,
-                "modified_at": stat.st_mtime,
-            })
-    return {"success": True, "data": files}
+    return {"success": True, "data": _scan_log_files(_LOG_DIR)}
+
+
+def _scan_log_files(log_dir: Path) -> list[dict[str, object]]:
+    """List regular files in log_dir sorted by name; a missing directory yields []."""
+    # os.scandir 复用目录项自带的类型信息，不必为每个文件构造 Path 再 is_file()
+    try:
+        with os.scandir(log_dir) as it:
+            entries = [entry for entry in it if entry.is_file()]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda entry: entry.name)
+    files: list[dict[str, object]] = []
+    for entry in entries:
+        stat = entry.stat()
+        files.append({
+            "name": entry.name,
+            "size_bytes": stat.st_size,
+            "modified_at": stat.st_mtime,
+        })
+    return files
 
 
 # ---------------------------------------------------------------------------
@@ -67,7 +76,7 @@ async def tail_log(filename: str) -> tuple[dict, int] | dict | Response:
     try:
         lines = _tail_file(path, n)
         return {"success": True, "data": {"filename": filename, "lines": lines}}
-    except Exception as exc:
+    except OSError as exc:
         return {"success": False, "message": str(exc)}, 500
 
 
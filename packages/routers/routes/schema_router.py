@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+
 from quart import Blueprint, current_app, request
 
 from ..deps import require_auth
@@ -236,6 +238,10 @@ PROVIDER_SCHEMAS: dict[str, dict] = {
 }
 
 
+# 键名包含任一关键词即视为敏感字段；单个正则一次扫描，代替逐个关键词的子串判断
+_SECRET_KEY_RE = re.compile("key|token|secret|password|credential", re.IGNORECASE)
+
+
 def _infer_field(key: str, value: object) -> dict:
     """Infer a field schema from a config key/value pair."""
     if isinstance(value, bool):
@@ -246,8 +252,7 @@ def _infer_field(key: str, value: object) -> dict:
         return {"type": "float", "label": key, "hint": None, "required": False, "default": value}
     if isinstance(value, list):
         return {"type": "list", "label": key, "hint": None, "required": False, "default": value}
-    secret_hints = ("key", "token", "secret", "password", "credential")
-    if any(h in key.lower() for h in secret_hints):
+    if _SECRET_KEY_RE.search(key):
         return {"type": "password", "label": key, "hint": None, "required": True, "default": ""}
     long_value = isinstance(value, str) and len(value) > 120
     return {
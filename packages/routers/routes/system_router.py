@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import sys
+import time
+from typing import Any
 
 from quart import Blueprint, current_app
 
@@ -9,6 +11,59 @@ from ..deps import require_auth
 system_bp = Blueprint("system", __name__, url_prefix="/api/v1/system")
 
 
+# psutil 为可选依赖。Process 对象跨请求复用：cpu_percent(interval=None) 返回的是
+# 距同一对象上次调用的占用率，每次新建对象只会得到 0.0
+_process: Any = None
+# 导入失败不会被缓存，每次 import 都会重新扫描 sys.path；确认缺失后不再尝试
+_psutil_missing = False
+
+
+# 多个页面同时轮询时，1 秒内复用同一份采样，避免反复读取 /proc
+_RESOURCE_TTL = 1.0
+_resource_cache: tuple[float, dict[str, Any]] | None = None
+
+
+def _resource_usage() -> dict[str, Any]:
+    """返回最近一次资源采样（至多 _RESOURCE_TTL 秒前）。"""
+    global _resource_cache
+    now = time.monotonic()
+    if _resource_cache is not None and now - _resource_cache[0] < _RESOURCE_TTL:
+        return _resource_cache[1]
+    usage = _sample_resources()
+    _resource_cache = (now, usage)
+    return usage
+
+
+def _sample_resources() -> dict[str, Any]:
+    """采样进程内存、CPU 占用与系统内存；未安装 psutil 时内存字段为 None。"""
+    global _process, _psutil_missing
+    if _psutil_missing:
+        return {"memory": None, "system_memory": None}
+    try:
+        import psutil
+    except ImportError:
+        _psutil_missing = True
+        return {"memory": None, "system_memory": None}
+
+    if _process is None:
+        _process = psutil.Process()
+        _process.cpu_percent(interval=None)  # 首次调用只建立基准，非阻塞
+    mem = _process.memory_info()
+    vm = psutil.virtual_memory()
+    return {
+        "memory": {"rss_bytes": mem.rss, "vms_bytes": mem.vms},
+        "cpu_percent": _process.cpu_percent(interval=None),
+        "system_memory": {"total": vm.total, "available": vm.available, "percent": vm.percent},
+    }
+
+
+def _uptime_seconds(start_monotonic: float | None) -> float | None:
+    """根据 create_app 记录的单调时钟起点计算运行时长（秒）。"""
+    if start_monotonic is None:
+        return None
+    return time.monotonic() - start_monotonic
+
+
 # ---------------------------------------------------------------------------
 # System info
 # ---------------------------------------------------------------------------
@@ -17,34 +72,14 @@ system_bp = Blueprint("system", __name__, url_prefix="/api/v1/system")
 @system_bp.route("/info", methods=["GET"])
 @require_auth
 async def system_info() -> tuple[dict, int] | dict:
-    import datetime
-
-    start_time = current_app.config.get("START_TIME")
-    now = datetime.datetime.now(datetime.timezone.utc)
-    uptime_seconds = (now - start_time).total_seconds() if start_time else None
+    uptime_seconds = _uptime_seconds(current_app.config.get("START_MONOTONIC"))
 
     info: dict = {
         "python_version": sys.version,
         "uptime_seconds": uptime_seconds,
     }
 
-    try:
-        import psutil
-        process = psutil.Process()
-        mem = process.memory_info()
-        info["memory"] = {
-            "rss_bytes": mem.rss,
-            "vms_bytes": mem.vms,
-        }
-        info["cpu_percent"] = process.cpu_percent(interval=None)
-        info["system_memory"] = {
-            "total": psutil.virtual_memory().total,
-            "available": psutil.virtual_memory().available,
-            "percent": psutil.virtual_memory().percent,
-        }
-    except ImportError:
-        info["memory"] = None
-        info["system_memory"] = None
+    info.update(_resource_usage())
 
     fw = current_app.config.get("FRAMEWORK")
     if fw is not None:
@@ -74,5 +109,5 @@ async def reload_config() -> tuple[dict, int] | dict:
         new_config = load_app_config(Path("data/config.json"))
         await fw.update_framework_config(new_config)
         return {"success": True, "message": "Config reloaded."}
-    except Exception as exc:
+    except (OSError, ValueError) as exc:
         return {"success": False, "message": str(exc)}, 500
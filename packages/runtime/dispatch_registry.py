@@ -6,6 +6,7 @@ EventHandlerRegistry: registered_event → list[EventHandlerEntry]     O(k) wher
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass
 
 from ..contracts.specs import CommandSpec, EventHandlerSpec
@@ -33,8 +34,12 @@ class CommandRegistry:
     """
 
     def __init__(self) -> None:
-        # lowercase name/alias → entry
+        # lowercase name/alias → entry（同名时最后注册者生效）
         self._index: dict[str, CommandEntry] = {}
+        # lowercase name/alias → 全部声明该名字的 entry，按注册顺序
+        self._claims: dict[str, list[CommandEntry]] = {}
+        # 被多个 entry 声明的 key，注册 / 注销时增量维护
+        self._conflicts: set[str] = set()
         # plugin_name → set of keys registered for that plugin
         self._by_plugin: dict[str, set[str]] = {}
 
@@ -53,16 +58,34 @@ class CommandRegistry:
             for name in (spec.name, *spec.aliases):
                 key = name.lower()
                 self._index[key] = entry
+                bucket = self._claims.setdefault(key, [])
+                bucket.append(entry)
+                if len(bucket) > 1:
+                    self._conflicts.add(key)
                 keys.add(key)
         self._by_plugin[plugin_name] = keys
 
     def unregister_plugin(self, plugin_name: str) -> None:
         for key in self._by_plugin.pop(plugin_name, set()):
-            self._index.pop(key, None)
+            remaining = [e for e in self._claims.get(key, ()) if e.plugin_name != plugin_name]
+            if not remaining:
+                self._claims.pop(key, None)
+                self._index.pop(key, None)
+                self._conflicts.discard(key)
+                continue
+            # 其他插件仍声明该名字：回退到剩余者中最后注册的那个
+            self._claims[key] = remaining
+            self._index[key] = remaining[-1]
+            if len(remaining) == 1:
+                self._conflicts.discard(key)
 
     def resolve(self, cmd_name: str) -> CommandEntry | None:
         return self._index.get(cmd_name.lower())
 
+    def conflicts(self) -> dict[str, tuple[CommandEntry, ...]]:
+        """Return names/aliases claimed more than once, with every claimant in registration order."""
+        return {key: tuple(self._claims[key]) for key in sorted(self._conflicts)}
+
     def __len__(self) -> int:
         return len(self._index)
 
@@ -76,29 +99,33 @@ class EventHandlerRegistry:
     """
 
     def __init__(self) -> None:
-        # registered_event → handlers
+        # registered_event → handlers（桶内按 priority 降序保存，同优先级保持注册顺序）
         self._index: dict[str, list[EventHandlerEntry]] = {}
-        # plugin_name → list of registered event names (may repeat)
-        self._by_plugin: dict[str, list[str]] = {}
+        # plugin_name → distinct registered event names，注销时每个桶只过滤一次
+        self._by_plugin: dict[str, tuple[str, ...]] = {}
+        # actual_event → 已解析结果；事件名集合有限，注册 / 注销时整体清空
+        self._resolved: dict[str, tuple[EventHandlerEntry, ...]] = {}
 
     def register(
         self,
         plugin_name: str,
         event_handlers: tuple[tuple[str, EventHandlerSpec], ...],
     ) -> None:
-        events: list[str] = []
+        events: dict[str, None] = {}
         for handler_name, spec in event_handlers:
             entry = EventHandlerEntry(
                 plugin_name=plugin_name,
                 handler_name=handler_name,
                 spec=spec,
             )
-            self._index.setdefault(spec.event, []).append(entry)
-            events.append(spec.event)
-        self._by_plugin[plugin_name] = events
+            bisect.insort(self._index.setdefault(spec.event, []), entry, key=_neg_priority)
+            events[spec.event] = None
+        self._by_plugin[plugin_name] = tuple(events)
+        self._resolved.clear()
 
     def unregister_plugin(self, plugin_name: str) -> None:
-        for event in self._by_plugin.pop(plugin_name, []):
+        self._resolved.clear()
+        for event in self._by_plugin.pop(plugin_name, ()):
             bucket = self._index.get(event)
             if bucket is None:
                 continue
@@ -110,14 +137,30 @@ class EventHandlerRegistry:
 
     def resolve(self, actual_event: str) -> list[EventHandlerEntry]:
         """Return matching entries sorted by priority descending (higher runs first)."""
-        results: list[EventHandlerEntry] = []
-        for registered_event, entries in self._index.items():
-            if registered_event == actual_event or actual_event.startswith(
-                f"{registered_event}."
-            ):
-                results.extend(entries)
-        results.sort(key=lambda e: e.spec.priority, reverse=True)
+        cached = self._resolved.get(actual_event)
+        if cached is None:
+            cached = self._resolved[actual_event] = tuple(self._match(actual_event))
+        return list(cached)
+
+    def _match(self, actual_event: str) -> list[EventHandlerEntry]:
+        matched: list[list[EventHandlerEntry]] = [
+            entries
+            for registered_event, entries in self._index.items()
+            if registered_event == actual_event
+            or actual_event.startswith(f"{registered_event}.")
+        ]
+        if not matched:
+            return []
+        # 仅一个桶命中（最常见）时桶本身已有序，无需合并排序；返回值由 resolve 复制
+        if len(matched) == 1:
+            return matched[0]
+        results = [entry for entries in matched for entry in entries]
+        results.sort(key=_neg_priority)
         return results
 
     def __len__(self) -> int:
         return sum(len(v) for v in self._index.values())
+
+
+def _neg_priority(entry: EventHandlerEntry) -> int:
+    return -entry.spec.priority
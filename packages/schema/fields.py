@@ -164,10 +164,10 @@ class ObjectSchema:
                 continue
             issues.extend(field_def.validate(payload[field_name], field_name))
 
-        if not self.allow_extra:
-            allowed = set(self.fields.keys())
+        # 常见情况下没有多余字段：一次 C 层子集判断即可跳过逐键扫描
+        if not self.allow_extra and not payload.keys() <= self.fields.keys():
             for key in payload:
-                if key not in allowed:
+                if key not in self.fields:
                     issues.append(
                         ValidationIssue(
                             path=key, message="field is not declared in schema"
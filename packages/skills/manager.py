@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
@@ -10,6 +11,8 @@ from loguru import logger
 if TYPE_CHECKING:
     from ..app import NekoBotFramework
 
+_SKILL_FILENAMES = ("skill.md", "SKILL.md")
+
 
 @dataclass(frozen=True)
 class SkillInfo:
@@ -42,16 +45,19 @@ class SkillManager:
         logger.info("SkillManager: loading skills from {}", search_dir)
         self._skills.clear()
 
+        # 单次 scandir：DirEntry 自带类型信息，无需为每个条目构造 Path 再 stat
         candidates: list[Path] = []
-        for entry in search_dir.iterdir():
-            if entry.is_file() and entry.suffix.lower() == ".md":
-                candidates.append(entry)
-            elif entry.is_dir():
-                skill_file = entry / "skill.md"
-                if not skill_file.exists():
-                    skill_file = entry / "SKILL.md"
-                if skill_file.exists():
-                    candidates.append(skill_file)
+        with os.scandir(search_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    if entry.name.lower().endswith(".md"):
+                        candidates.append(Path(entry.path))
+                elif entry.is_dir():
+                    for skill_name in _SKILL_FILENAMES:
+                        skill_path = os.path.join(entry.path, skill_name)
+                        if os.path.isfile(skill_path):
+                            candidates.append(Path(skill_path))
+                            break
 
         for path in candidates:
             await self._load_skill_file(path)
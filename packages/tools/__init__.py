@@ -1,6 +1,20 @@
-from .mcp import MCPManager, MCPServerConfig, PluginMCPServer
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 from .registry import ToolBackend, ToolEntry, ToolRegistry
 
+if TYPE_CHECKING:
+    from .mcp import MCPManager, MCPServerConfig, PluginMCPServer
+
+# MCP 相关导出按需加载，避免仅使用 ToolRegistry 时拖入 mcp SDK
+_LAZY: dict[str, str] = {
+    "MCPManager": ".mcp",
+    "MCPServerConfig": ".mcp",
+    "PluginMCPServer": ".mcp",
+}
+
 __all__ = [
     "ToolBackend",
     "ToolEntry",
@@ -9,3 +23,16 @@ __all__ = [
     "MCPServerConfig",
     "PluginMCPServer",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
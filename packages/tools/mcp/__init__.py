@@ -1,5 +1,31 @@
-from .manager import MCPManager
-from .server import PluginMCPServer
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 from .types import MCPServerConfig
 
+if TYPE_CHECKING:
+    from .manager import MCPManager
+    from .server import PluginMCPServer
+
+# manager 依赖 mcp client SDK，server 依赖 FastMCP；均在首次访问时加载
+_LAZY: dict[str, str] = {
+    "MCPManager": ".manager",
+    "PluginMCPServer": ".server",
+}
+
 __all__ = ["MCPManager", "MCPServerConfig", "PluginMCPServer"]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
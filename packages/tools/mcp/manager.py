@@ -4,23 +4,27 @@ from typing import TYPE_CHECKING, Union
 
 from loguru import logger
 
-from .http import StreamableHTTPMCPClient
-from .sse import SSEMCPClient
-from .stdio import StdioMCPClient
 from .types import MCPServerConfig
 
 if TYPE_CHECKING:
     from ..registry import ToolRegistry
+    from .http import StreamableHTTPMCPClient
+    from .sse import SSEMCPClient
+    from .stdio import StdioMCPClient
 
-_AnyMCPClient = Union[StdioMCPClient, SSEMCPClient, StreamableHTTPMCPClient]
+_AnyMCPClient = Union["StdioMCPClient", "SSEMCPClient", "StreamableHTTPMCPClient"]
 
 
 def _make_client(config: MCPServerConfig) -> _AnyMCPClient:
+    # transport 实现按需导入：未配置 MCP server 时不加载 mcp client SDK
     if config.transport == "stdio":
+        from .stdio import StdioMCPClient
         return StdioMCPClient(config)
     if config.transport == "sse":
+        from .sse import SSEMCPClient
         return SSEMCPClient(config)
     if config.transport == "http":
+        from .http import StreamableHTTPMCPClient
         return StreamableHTTPMCPClient(config)
     raise ValueError(
         f"unknown MCP transport {config.transport!r} for server {config.name!r}"
@@ -51,6 +55,8 @@ class MCPManager:
     def __init__(self, tool_registry: ToolRegistry) -> None:
         self._tool_registry = tool_registry
         self._clients: dict[str, _AnyMCPClient] = {}
+        # 已连接 server 名称快照，仅在增删时重建（WebUI 会频繁轮询）
+        self._server_names: tuple[str, ...] = ()
 
     async def load(self, configs: list[MCPServerConfig]) -> None:
         """Connect all enabled servers and sync their tools."""
@@ -74,6 +80,7 @@ class MCPManager:
             return False
 
         self._clients[config.name] = client
+        self._server_names = tuple(self._clients)
         self._tool_registry.add_backend(config.name, client)
         await self._tool_registry.sync_backends()
         return True
@@ -83,6 +90,7 @@ class MCPManager:
         client = self._clients.pop(name, None)
         if client is None:
             return
+        self._server_names = tuple(self._clients)
         try:
             await client.stop()
         except Exception as exc:
@@ -105,16 +113,16 @@ class MCPManager:
             return False
 
     async def refresh_all(self) -> None:
-        for name in list(self._clients):
+        for name in self._server_names:
             await self.refresh_server(name)
 
     async def stop_all(self) -> None:
-        for name in list(self._clients):
+        for name in self._server_names:
             await self.remove_server(name)
 
     @property
-    def connected_servers(self) -> list[str]:
-        return list(self._clients)
+    def connected_servers(self) -> tuple[str, ...]:
+        return self._server_names
 
     def tool_count(self, server_name: str) -> int:
         client = self._clients.get(server_name)
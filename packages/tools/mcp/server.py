@@ -20,6 +20,7 @@ Usage::
 from __future__ import annotations
 
 import functools
+import inspect
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
@@ -41,7 +42,8 @@ class PluginMCPServer:
     ) -> None:
         self._tool_registry = tool_registry
         self._mcp = FastMCP(name=name, instructions=instructions)
-        self._registered_names: set[str] = set()
+        # 已注册到 FastMCP 的工具名（dict 保持注册顺序），由 sync 增量维护
+        self._registered_names: dict[str, None] = {}
 
     # ------------------------------------------------------------------
     # Sync tools from ToolRegistry → FastMCP
@@ -56,32 +58,39 @@ class PluginMCPServer:
         current_names = {d.name for d in defs}
 
         # Remove tools that no longer exist — uses public SDK API
-        for name in self._registered_names - current_names:
+        removed = sorted(self._registered_names.keys() - current_names)
+        for name in removed:
             self._mcp.remove_tool(name)
-            logger.debug("PluginMCPServer: removed tool {!r}", name)
+            del self._registered_names[name]
 
         # Add tools not yet registered
+        added: list[str] = []
         for entry_list in self._tool_registry._plugin_tools.values():
             for entry in entry_list:
                 if entry.name in self._registered_names:
                     continue
                 self._add_tool(entry.name, entry.description, entry.handler)
+                self._registered_names[entry.name] = None
+                added.append(entry.name)
+
+        # 变更汇总成一条日志，而不是每个工具各写一条
+        if removed or added:
+            logger.debug("PluginMCPServer: removed {}, registered {}", removed, added)
 
-        # Reflect actual registered state via public list_tools()
-        self._registered_names = {t.name for t in self._mcp.list_tools()}
         logger.info(
             "PluginMCPServer: synced {} tool(s)", len(self._registered_names)
         )
 
-    def _add_tool(
-        self, name: str, description: str, handler: Any
-    ) -> None:
+    def _add_tool(self, name: str, description: str, handler: Any) -> None:
         """Wrap handler so FastMCP can call it (drops positional plugin instance arg)."""
-
+        # 统一用异步包装：同步 handler 也可能返回 awaitable（装饰器包装、async __call__）
         @functools.wraps(handler)
         async def _wrapper(**kwargs: Any) -> Any:
             # plugin tools expect (self, **kwargs) — call without instance for MCP
-            return await handler(**kwargs)
+            result = handler(**kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
 
         _wrapper.__name__ = name
         _wrapper.__doc__ = description
@@ -97,7 +106,6 @@ class PluginMCPServer:
             description=description,
             structured_output=False,
         )
-        logger.debug("PluginMCPServer: registered tool {!r}", name)
 
     # ------------------------------------------------------------------
     # Transport: stdio
@@ -168,4 +176,5 @@ class PluginMCPServer:
 
     @property
     def tool_names(self) -> list[str]:
-        return [t.name for t in self._mcp.list_tools()]
+        # FastMCP.list_tools() 是协程且每次都构造完整的 Tool 描述，这里直接用本地记录
+        return list(self._registered_names)
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
-from typing import Any, Protocol, runtime_checkable
+from dataclasses import dataclass, field
+from typing import Any, Protocol, cast, runtime_checkable
 
 from loguru import logger
 
 from ..providers.types import ToolCall, ToolDefinition
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolEntry:
     """单个工具的运行时记录。"""
     name: str
@@ -18,9 +20,21 @@ class ToolEntry:
     parameters_schema: dict[str, Any]
     # handler 签名：(plugin_instance_or_none, **kwargs) -> object
     # plugin backend 时第一个位置参数是插件实例；MCP backend 时为 None
-    handler: Callable[..., Awaitable[object]]
+    handler: Callable[..., Awaitable[object] | object]
     plugin_name: str          # 来源插件名，卸载时批量清理
     backend: str = "plugin"   # "plugin" 或 "mcp:<server_name>"
+    # 注册时判定一次 handler 是否为协程函数，作为调用路径上的快速判断；
+    # 返回 awaitable 的普通函数（装饰器包装、async __call__ 对象）由 dispatch 兜底
+    is_async: bool = True
+    # 构造时生成一次，get_tool_definitions 直接复用（字段视为只读）
+    definition: ToolDefinition = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.definition = ToolDefinition(
+            name=self.name,
+            description=self.description,
+            parameters=self.parameters_schema,
+        )
 
 
 @runtime_checkable
@@ -41,8 +55,24 @@ class ToolRegistry:
     def __init__(self) -> None:
         # plugin_name -> list[ToolEntry]
         self._plugin_tools: dict[str, list[ToolEntry]] = {}
+        # tool_name -> ToolEntry，同名时先注册者生效（与定义列表一致），供 dispatch O(1) 查找
+        self._plugin_index: dict[str, ToolEntry] = {}
         # server_name -> ToolBackend
         self._backends: dict[str, ToolBackend] = {}
+        # tool_name -> ToolEntry，由 sync_backends 整体替换
+        self._backend_cache: dict[str, ToolEntry] = {}
+        # get_tool_definitions 结果缓存，任一注册表变更时置空
+        self._definitions: tuple[ToolDefinition, ...] | None = None
+        self._version: int = 0
+
+    @property
+    def version(self) -> int:
+        """工具集变更计数，外部缓存可据此判断是否需要重建。"""
+        return self._version
+
+    def _invalidate(self) -> None:
+        self._definitions = None
+        self._version += 1
 
     # ------------------------------------------------------------------
     # Plugin tool 注册（由 FrameworkBinder 调用）
@@ -55,7 +85,7 @@ class ToolRegistry:
         tool_name: str,
         description: str,
         parameters_schema: dict[str, Any],
-        handler: Callable[..., Awaitable[object]],
+        handler: Callable[..., Awaitable[object] | object],
     ) -> None:
         entry = ToolEntry(
             name=tool_name,
@@ -64,17 +94,29 @@ class ToolRegistry:
             handler=handler,
             plugin_name=plugin_name,
             backend="plugin",
+            is_async=inspect.iscoroutinefunction(handler),
         )
         self._plugin_tools.setdefault(plugin_name, []).append(entry)
+        self._plugin_index.setdefault(tool_name, entry)
+        self._invalidate()
         logger.debug("ToolRegistry: registered tool {!r} from plugin {!r}", tool_name, plugin_name)
 
     def unregister_plugin(self, plugin_name: str) -> int:
         """注销某插件的所有工具，返回注销数量。"""
         removed = self._plugin_tools.pop(plugin_name, [])
         if removed:
+            self._rebuild_plugin_index()
+            self._invalidate()
             logger.debug("ToolRegistry: unregistered {} tool(s) from plugin {!r}", len(removed), plugin_name)
         return len(removed)
 
+    def _rebuild_plugin_index(self) -> None:
+        index: dict[str, ToolEntry] = {}
+        for entries in self._plugin_tools.values():
+            for e in entries:
+                index.setdefault(e.name, e)
+        self._plugin_index = index
+
     # ------------------------------------------------------------------
     # MCP / 外部 backend
     # ------------------------------------------------------------------
@@ -93,44 +135,47 @@ class ToolRegistry:
 
     def get_tool_definitions(self) -> list[ToolDefinition]:
         """返回所有可用工具的 ToolDefinition 列表（供 provider 注入）。"""
+        if self._definitions is None:
+            self._definitions = tuple(self._build_definitions())
+        return list(self._definitions)
+
+    def _build_definitions(self) -> list[ToolDefinition]:
         defs: list[ToolDefinition] = []
         seen: set[str] = set()
 
         for entries in self._plugin_tools.values():
             for e in entries:
                 if e.name not in seen:
-                    defs.append(ToolDefinition(
-                        name=e.name,
-                        description=e.description,
-                        parameters=e.parameters_schema,
-                    ))
+                    defs.append(e.definition)
                     seen.add(e.name)
 
         # MCP backend 工具在调用时才拉取，避免 get_tool_definitions 变成 async
-        # 通过 _backend_tool_cache 缓存（由 sync_backend 方法填充）
+        # 通过 _backend_cache 缓存（由 sync_backends 方法填充）
         for entry in self._backend_cache.values():
             if entry.name not in seen:
-                defs.append(ToolDefinition(
-                    name=entry.name,
-                    description=entry.description,
-                    parameters=entry.parameters_schema,
-                ))
+                defs.append(entry.definition)
                 seen.add(entry.name)
 
         return defs
 
     async def sync_backends(self) -> None:
         """拉取所有外部 backend 的最新工具列表，更新缓存。"""
+        # 各 backend 互不依赖，并发拉取；结果按注册顺序合并，同名工具后者覆盖前者
+        backends = list(self._backends.items())
+        results = await asyncio.gather(
+            *(backend.list_tools() for _, backend in backends),
+            return_exceptions=True,
+        )
         new_cache: dict[str, ToolEntry] = {}
-        for backend_name, backend in self._backends.items():
-            try:
-                entries = await backend.list_tools()
-                for e in entries:
-                    new_cache[e.name] = e
-                logger.debug("ToolRegistry: synced {} tool(s) from backend {!r}", len(entries), backend_name)
-            except Exception as exc:
-                logger.warning("ToolRegistry: failed to sync backend {!r}: {}", backend_name, exc)
+        for (backend_name, _), entries in zip(backends, results):
+            if isinstance(entries, BaseException):
+                logger.warning("ToolRegistry: failed to sync backend {!r}: {}", backend_name, entries)
+                continue
+            for e in entries:
+                new_cache[e.name] = e
+            logger.debug("ToolRegistry: synced {} tool(s) from backend {!r}", len(entries), backend_name)
         self._backend_cache = new_cache
+        self._invalidate()
 
     # ------------------------------------------------------------------
     # 工具调用分发
@@ -146,18 +191,19 @@ class ToolRegistry:
         args = dict(tool_call.arguments)
 
         # 优先查 plugin tools
-        for entries in self._plugin_tools.values():
-            for e in entries:
-                if e.name == name:
-                    try:
-                        if plugin_instance is not None:
-                            result = await e.handler(plugin_instance, **args)
-                        else:
-                            result = await e.handler(**args)
-                        return _serialize_result(result)
-                    except Exception as exc:
-                        logger.error("ToolRegistry: tool {!r} raised: {}", name, exc)
-                        return json.dumps({"error": str(exc)})
+        e = self._plugin_index.get(name)
+        if e is not None:
+            try:
+                if plugin_instance is not None:
+                    result = e.handler(plugin_instance, **args)
+                else:
+                    result = e.handler(**args)
+                if e.is_async or inspect.isawaitable(result):
+                    result = await cast(Awaitable[object], result)
+                return _serialize_result(result)
+            except Exception as exc:
+                logger.opt(exception=exc).error("ToolRegistry: tool {!r} raised: {}", name, exc)
+                return json.dumps({"error": str(exc)})
 
         # 查 backend cache
         cached = self._backend_cache.get(name)
@@ -169,7 +215,7 @@ class ToolRegistry:
                     result = await backend.call_tool(name, args)
                     return _serialize_result(result)
                 except Exception as exc:
-                    logger.error("ToolRegistry: backend tool {!r} raised: {}", name, exc)
+                    logger.opt(exception=exc).error("ToolRegistry: backend tool {!r} raised: {}", name, exc)
                     return json.dumps({"error": str(exc)})
 
         logger.warning("ToolRegistry: unknown tool {!r}", name)
@@ -179,20 +225,6 @@ class ToolRegistry:
         total = sum(len(v) for v in self._plugin_tools.values())
         return total + len(self._backend_cache)
 
-    # ------------------------------------------------------------------
-    # 内部
-    # ------------------------------------------------------------------
-
-    @property
-    def _backend_cache(self) -> dict[str, ToolEntry]:
-        if not hasattr(self, "_backend_cache_dict"):
-            self._backend_cache_dict: dict[str, ToolEntry] = {}
-        return self._backend_cache_dict
-
-    @_backend_cache.setter
-    def _backend_cache(self, value: dict[str, ToolEntry]) -> None:
-        self._backend_cache_dict = value
-
 
 def _serialize_result(result: object) -> str:
     if isinstance(result, str):
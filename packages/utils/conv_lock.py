@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from typing import AsyncGenerator
 
 
+@dataclass(slots=True)
+class _LockEntry:
+    """单个会话的锁及其持有/等待者计数。"""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    refs: int = 0
+
+
 class ConversationLockManager:
     """Reference-counted per-conversation async lock manager.
 
@@ -20,24 +28,24 @@ class ConversationLockManager:
     """
 
     def __init__(self) -> None:
-        self._locks: dict[str, asyncio.Lock] = {}
-        self._counts: dict[str, int] = defaultdict(int)
+        self._locks: dict[str, _LockEntry] = {}
         self._meta: asyncio.Lock = asyncio.Lock()
 
     @asynccontextmanager
     async def acquire(self, key: str) -> AsyncGenerator[None, None]:
         async with self._meta:
-            lock = self._locks.setdefault(key, asyncio.Lock())
-            self._counts[key] += 1
+            entry = self._locks.get(key)
+            if entry is None:
+                entry = self._locks[key] = _LockEntry()
+            entry.refs += 1
         try:
-            async with lock:
+            async with entry.lock:
                 yield
         finally:
             async with self._meta:
-                self._counts[key] -= 1
-                if self._counts[key] == 0:
+                entry.refs -= 1
+                if entry.refs == 0:
                     self._locks.pop(key, None)
-                    self._counts.pop(key, None)
 
     def active_count(self) -> int:
         """Return number of currently tracked locks (for diagnostics)."""
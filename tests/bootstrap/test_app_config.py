@@ -7,6 +7,7 @@ from packages.bootstrap.config import (
     BootstrapConfig,
     load_app_config,
     normalize_app_config,
+    save_app_config_raw,
 )
 from packages.bootstrap.defaults import INITIAL_CONFIG_TEMPLATE
 
@@ -63,3 +64,13 @@ def test_load_app_config_reads_json_file(tmp_path: Path) -> None:
 
     assert config.framework_config.get("default_provider") == "gemini"
     assert config.platforms == [{"type": "onebot_v11", "instance_uuid": "bot-a"}]
+
+
+def test_save_app_config_raw_replaces_file_atomically(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"framework_config": {"stale": true}', encoding="utf-8")
+
+    save_app_config_raw({"framework_config": {"web_port": 7000}}, config_path)
+
+    assert json.loads(config_path.read_text(encoding="utf-8")) == {"framework_config": {"web_port": 7000}}
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
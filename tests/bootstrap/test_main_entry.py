@@ -3,7 +3,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from main import async_main
+import pytest
+
+from main import _HELP_TEXT, _eager_tasks_enabled, _log_level, _parse_args, async_main, main, show_help
 
 
 async def test_async_main_returns_runtime_without_blocking_when_run_forever_is_false(
@@ -24,3 +26,83 @@ async def test_async_main_returns_runtime_without_blocking_when_run_forever_is_f
 
     assert runtime.configuration.resolve_provider_name() == "openai"
     assert runtime.running_platforms == ()
+
+
+def test_parse_args_accepts_separate_and_inline_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("NEKOBOT_HOST", raising=False)
+    monkeypatch.delenv("NEKOBOT_PORT", raising=False)
+
+    args = _parse_args(["--no-webui", "--config", "c.json", "--host=127.0.0.1", "--port", "8080"])
+
+    assert args.webui is False
+    assert args.config == "c.json"
+    assert args.host == "127.0.0.1"
+    assert args.port == 8080
+
+
+def test_parse_args_falls_back_to_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NEKOBOT_HOST", "10.0.0.1")
+    monkeypatch.setenv("NEKOBOT_PORT", "7000")
+
+    args = _parse_args([])
+
+    assert args.webui is None
+    assert args.host == "10.0.0.1"
+    assert args.port == 7000
+
+
+def test_parse_args_keeps_explicit_port_zero(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NEKOBOT_PORT", "0")
+
+    assert _parse_args([]).port is None
+    assert _parse_args(["--port", "0"]).port == 0
+
+
+def test_parse_args_accepts_unique_prefix_abbreviations(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("NEKOBOT_PORT", raising=False)
+
+    args = _parse_args(["--po", "8080", "--conf=c.json", "--no", "--ho", "::1"])
+
+    assert (args.port, args.config, args.webui, args.host) == (8080, "c.json", False, "::1")
+    assert _parse_args(["--he"]).show_help is True
+    with pytest.raises(ValueError, match="ambiguous option"):
+        _parse_args(["--h"])
+
+
+def test_parse_args_help_only_in_option_position() -> None:
+    assert _parse_args(["--no-webui", "-h"]).show_help is True
+    assert _parse_args(["--help", "--bogus"]).show_help is True
+    assert _parse_args(["--config=-h"]).config == "-h"
+    with pytest.raises(ValueError, match="expected one argument"):
+        _ = _parse_args(["--config", "-h"])
+
+
+@pytest.mark.parametrize("argv", [["--bogus"], ["--port", "abc"], ["--config"], ["--config", "-h"]])
+def test_main_rejects_invalid_arguments(argv: list[str], capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(argv) == 2
+    assert "error" in capsys.readouterr().err
+
+
+def test_main_help_exits_cleanly(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["--help"]) == 0
+    assert "--webui" in capsys.readouterr().out
+
+
+def test_show_help_writes_help_text_verbatim(capsys: pytest.CaptureFixture[str]) -> None:
+    assert show_help() == 0
+    out = capsys.readouterr().out
+    assert out == _HELP_TEXT
+    assert out.startswith("usage: main.py") and out.endswith("\n")
+
+
+@pytest.mark.parametrize(("value", "expected"), [("1", True), ("on", True), ("", False), ("0", False)])
+def test_eager_tasks_flag_reads_env(monkeypatch: pytest.MonkeyPatch, value: str, expected: bool) -> None:
+    monkeypatch.setenv("NEKOBOT_EAGER_TASKS", value)
+    assert _eager_tasks_enabled() is expected
+
+
+def test_log_level_reads_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("NEKOBOT_LOG_LEVEL", raising=False)
+    assert _log_level("DEBUG") == "DEBUG"
+    monkeypatch.setenv("NEKOBOT_LOG_LEVEL", " warning ")
+    assert _log_level("DEBUG") == "WARNING"
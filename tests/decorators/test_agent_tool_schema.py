@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from enum import IntEnum, StrEnum
+from typing import Optional
+
+import pytest
+
+from packages.contracts.specs import AgentToolSpec
+from packages.decorators import core
+from packages.decorators.core import AGENT_TOOL_SPEC_ATTR, _schema_from_fn, agent_tool
+
+
+class Mode(StrEnum):
+    FAST = "fast"
+
+
+class Level(IntEnum):
+    LOW = 1
+
+
+def test_schema_infers_types_and_required() -> None:
+    async def search(self, query: str, limit: int = 5, tags: list[str] | None = None) -> str:
+        return ""
+
+    assert _schema_from_fn(search) == {
+        "type": "object",
+        "properties": {
+            "query": {"type": "string"},
+            "limit": {"type": "integer"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["query"],
+    }
+
+
+def test_schema_optional_params_are_not_required() -> None:
+    def fn(a: Optional[float], b: bool | None, c: dict[str, int]) -> None:
+        return None
+
+    schema = _schema_from_fn(fn)
+
+    assert schema["properties"] == {
+        "a": {"type": "number"},
+        "b": {"type": "boolean"},
+        "c": {"type": "object"},
+    }
+    assert schema["required"] == ["c"]
+
+
+def test_schema_skips_varargs_and_unannotated() -> None:
+    def fn(self, x, *args: int, **kwargs: str) -> None:
+        return None
+
+    assert _schema_from_fn(fn) == {"type": "object", "properties": {"x": {}}, "required": ["x"]}
+
+
+def test_agent_tool_attaches_spec() -> None:
+    @agent_tool(description="ping")
+    async def ping(self, host: str) -> str:
+        return host
+
+    spec = getattr(ping, AGENT_TOOL_SPEC_ATTR)
+    assert isinstance(spec, AgentToolSpec)
+    assert spec.name == "ping"
+    assert spec.parameters_schema["required"] == ["host"]
+
+
+def test_schema_maps_builtin_subclasses_via_mro() -> None:
+    def fn(mode: Mode, level: Level, flag: bool) -> None:
+        return None
+
+    assert _schema_from_fn(fn)["properties"] == {
+        "mode": {"type": "string"},
+        "level": {"type": "integer"},
+        "flag": {"type": "boolean"},
+    }
+
+
+def test_schema_for_parameterless_tool_skips_hint_resolution(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail(*_: object, **__: object) -> dict:
+        raise AssertionError("get_type_hints should not be called")
+
+    monkeypatch.setattr(core, "get_type_hints", _fail)
+
+    async def ping(self, *args: int, **kwargs: str) -> str:
+        return ""
+
+    assert _schema_from_fn(ping) == {"type": "object", "properties": {}}
+
+
+def test_schema_resolves_optional_once_per_parameter(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[object] = []
+    real_is_optional = core._is_optional
+
+    def counting(annotation: object) -> tuple[bool, object]:
+        calls.append(annotation)
+        return real_is_optional(annotation)
+
+    monkeypatch.setattr(core, "_is_optional", counting)
+
+    def fn(a: int | None, b: str) -> None:
+        return None
+
+    assert _schema_from_fn(fn)["properties"] == {"a": {"type": "integer"}, "b": {"type": "string"}}
+    assert len(calls) == 2
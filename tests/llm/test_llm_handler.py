@@ -3,6 +3,8 @@ image URL forwarding, retry/recall flow, and quoted message injection."""
 
 from __future__ import annotations
 
+import asyncio
+import functools
 from dataclasses import replace
 from typing import override
 from unittest.mock import patch
@@ -10,12 +12,14 @@ from unittest.mock import patch
 from packages.app import NekoBotFramework
 from packages.contracts.specs import ProviderSpec, RegisteredProvider
 from packages.conversations.context import ConfigurationContext, ConversationContext
+from packages.conversations.persistence import InMemoryConversationStore
 from packages.llm.handler import LLMHandler, _noop_recall
 from packages.providers.base import ChatProvider
 from packages.providers.types import (
     ProviderErrorInfo,
     ProviderRequest,
     ProviderResponse,
+    ToolCall,
 )
 from packages.runtime.context import ExecutionContext
 
@@ -559,3 +563,121 @@ async def test_openai_build_messages_no_images_stays_string() -> None:
     messages = provider._build_messages(request)
     last = messages[-1]
     assert last["content"] == "hello"  # type: ignore[index]
+
+
+async def test_group_wake_keyword_matches_any_configured_keyword() -> None:
+    fw = _make_framework()
+    cfg = _make_configuration(fw, extra_plugin_config={"wake_keywords": ["cat", "喵", "a.b", 3]})
+    handler = LLMHandler(fw)
+    for text, expected in (("hi 喵", 1), ("axb", 0), ("a.b?", 1), ("CAT", 0)):
+        replies = await _run_handler(
+            handler,
+            payload={"plain_text": text, "effective_text": text, "segments": []},
+            execution=_make_group_execution(),
+            configuration=cfg,
+        )
+        assert len(replies) == expected, text
+
+
+# ===========================================================================
+# Tool loop
+# ===========================================================================
+
+
+def _always_tool_call_provider(calls: list[tuple[int, int]]) -> type[ChatProvider]:
+    """Provider that requests view_skill whenever tools are offered; records (tools, messages) per call."""
+
+    class AlwaysToolCallProvider(ChatProvider):
+        @override
+        @classmethod
+        def provider_spec(cls) -> ProviderSpec:
+            return ProviderSpec(name="always-tool", kind="chat", capabilities=("chat",))
+
+        @override
+        async def generate(self, request: ProviderRequest) -> ProviderResponse:
+            calls.append((len(request.tools), len(request.messages)))
+            if not request.tools:
+                return ProviderResponse(content="final")
+            return ProviderResponse(tool_calls=[ToolCall(id="c1", name="view_skill", arguments={"name": "x"})])
+
+    return AlwaysToolCallProvider
+
+
+async def test_tool_loop_forces_final_call_without_tools_after_max_iterations() -> None:
+    calls: list[tuple[int, int]] = []
+    provider_class = _always_tool_call_provider(calls)
+    # 独立的内存存储，避免受持久化历史影响
+    fw = NekoBotFramework(conversation_store=InMemoryConversationStore())
+    fw.runtime_registry.register_provider(
+        RegisteredProvider(provider_class=provider_class, spec=provider_class.provider_spec())
+    )
+    cfg = _make_configuration(fw, provider="always-tool", extra_plugin_config={"tool_max_iterations": 2})
+    handler = LLMHandler(fw)
+
+    replies = await _run_handler(
+        handler,
+        payload={"plain_text": "hi", "effective_text": "hi"},
+        configuration=cfg,
+    )
+
+    assert replies == ["final"]
+    assert len(calls) == 3
+    (first_tools, first_msgs), (second_tools, second_msgs), (final_tools, final_msgs) = calls
+    assert first_tools > 0 and second_tools > 0
+    assert final_tools == 0
+    # 每轮追加 assistant tool_calls + tool result 两条消息
+    assert second_msgs == first_msgs + 2
+    assert final_msgs == first_msgs + 4
+
+
+async def test_tool_calls_in_one_turn_run_concurrently() -> None:
+    calls: list[tuple[int, int]] = []
+    both_started = asyncio.Event()
+    started: list[str] = []
+
+    async def _tool(plugin: object, name: str) -> str:
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        # 串行执行时第一个工具会在这里超时
+        await asyncio.wait_for(both_started.wait(), timeout=1.0)
+        return f"ok:{name}"
+
+    class TwoToolsProvider(ChatProvider):
+        @override
+        @classmethod
+        def provider_spec(cls) -> ProviderSpec:
+            return ProviderSpec(name="two-tools", kind="chat", capabilities=("chat",))
+
+        @override
+        async def generate(self, request: ProviderRequest) -> ProviderResponse:
+            calls.append((len(request.tools), len(request.messages)))
+            if len(calls) == 1:
+                return ProviderResponse(tool_calls=[
+                    ToolCall(id="a", name="wait_a", arguments={"name": "a"}),
+                    ToolCall(id="b", name="wait_b", arguments={"name": "b"}),
+                ])
+            tool_msgs = [m for m in request.messages if m.role == "tool"]
+            return ProviderResponse(content=",".join(m.content for m in tool_msgs))
+
+    fw = NekoBotFramework(conversation_store=InMemoryConversationStore())
+    fw.runtime_registry.register_provider(
+        RegisteredProvider(provider_class=TwoToolsProvider, spec=TwoToolsProvider.provider_spec())
+    )
+    for tool_name in ("wait_a", "wait_b"):
+        fw.tool_registry.register_tool(
+            plugin_name="concurrency",
+            tool_name=tool_name,
+            description="",
+            parameters_schema={"type": "object"},
+            handler=functools.partial(_tool, None),
+        )
+    cfg = _make_configuration(fw, provider="two-tools")
+
+    replies = await _run_handler(
+        LLMHandler(fw),
+        payload={"plain_text": "hi", "effective_text": "hi"},
+        configuration=cfg,
+    )
+
+    assert replies == ["ok:a,ok:b"]
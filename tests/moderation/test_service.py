@@ -112,3 +112,26 @@ async def test_moderation_service_raises_for_unknown_preferred_backend() -> None
         assert "moderation backend not found" in str(exc)
     else:
         raise AssertionError("expected KeyError for missing moderation backend")
+
+
+async def test_moderation_service_review_tolerates_registration_mid_review() -> None:
+    service = ModerationService()
+
+    class RegisteringBackend(FakeBackend):
+        @override
+        async def review(self, request: ModerationRequest) -> ModerationDecision:
+            service.register_backend(
+                FakeBackend("late", ModerationDecision(action="block"))
+            )
+            return await super().review(request)
+
+    service.register_backend(
+        RegisteringBackend("first", ModerationDecision(action="allow"))
+    )
+
+    decision = await service.review(
+        ModerationRequest(stage=ModerationStage.INPUT, text="hello")
+    )
+
+    assert decision.action == "allow"
+    assert service.list_backends() == ("first", "late")
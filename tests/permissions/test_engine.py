@@ -167,3 +167,12 @@ def test_evaluate_returns_decision_with_reason() -> None:
     decision = engine.evaluate(("cmd.run",), _ctx())
     assert decision.allowed is True
     assert decision.reason != ""
+
+
+def test_rule_matches_context_with_and_without_precomputed_roles() -> None:
+    rule = PermissionRule(permissions=("x",), roles=("admin", "mod"), require_all=True)
+    ctx = _ctx(roles=("admin",), group_roles=("mod",))
+
+    assert rule.matches_context(ctx) is True
+    assert rule.matches_context(ctx, frozenset({"admin"})) is False
+    assert rule == PermissionRule(permissions=("x",), roles=("admin", "mod"), require_all=True)
@@ -134,3 +134,34 @@ def test_parse_notice_event_includes_subtype_when_present() -> None:
     )
 
     assert notice.event_name == "notice.notify.poke"
+
+
+def test_parse_message_normalizes_media_and_card_segments() -> None:
+    parser = OneBotV11EventParser()
+    raw_event = {
+        "post_type": "message",
+        "message_type": "private",
+        "user_id": "u-1",
+        "message": [
+            {"type": "record", "data": {"file": "a.amr"}},
+            {"type": "mface", "data": {"summary": "[喵]"}},
+            {"type": "reply", "data": {"id": "7"}},
+            {"type": "json", "data": {"data": "{}"}},
+            {"type": "dice", "data": {}},
+        ],
+    }
+
+    event = parser.parse(cast(ValueMap, raw_event), platform_instance_uuid="instance-1")
+
+    assert [seg.type for seg in event.segments] == [
+        SegmentType.VOICE,
+        SegmentType.STICKER,
+        SegmentType.REPLY,
+        SegmentType.CARD,
+        SegmentType.UNKNOWN,
+    ]
+    assert event.segments[0].data == {"file": "a.amr"}
+    assert event.segments[2].data == {"message_id": "7"}
+    assert event.segments[3].data["card_type"] == "json"
+    assert event.segments[4].data["original_type"] == "dice"
+    assert event.plain_text is None
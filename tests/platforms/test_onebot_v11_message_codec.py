@@ -52,3 +52,16 @@ def test_encode_skips_blank_text_segments() -> None:
     )
 
     assert payload == [{"type": "text", "data": {"text": "ok"}}]
+
+
+def test_encode_passes_through_other_types_and_drops_unknown() -> None:
+    codec = OneBotV11MessageCodec()
+    payload = codec.encode(
+        [
+            codec.record("base64://voice"),
+            OneBotV11MessageSegment(type=OneBotV11SegmentType.UNKNOWN, data={"x": 1}),
+            OneBotV11MessageSegment(type=OneBotV11SegmentType.AT, data={"user_id": 5}),
+        ]
+    )
+
+    assert payload == [{"type": "record", "data": {"file": "base64://voice"}}]
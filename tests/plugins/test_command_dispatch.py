@@ -259,3 +259,30 @@ async def test_plugin_reloader_load_directory(tmp_path: object) -> None:
     assert "dir-plugin" in results["myplugin"]
     assert "dir-plugin" in framework.runtime_registry.plugins
     assert "notaplugin" not in results
+
+
+async def test_on_event_fallback_skips_plugins_without_override() -> None:
+    """Plugins that keep BasePlugin.on_event are not instantiated for the fallback."""
+    created: list[str] = []
+    seen_events: list[str] = []
+
+    @plugin(name="quiet-plugin")
+    class QuietPlugin(BasePlugin):
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            created.append("quiet")
+            super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+
+    @plugin(name="loud-plugin")
+    class LoudPlugin(BasePlugin):
+        async def on_event(self, event_name: str, payload: dict[str, object]) -> None:
+            seen_events.append(event_name)
+
+    framework = NekoBotFramework()
+    framework.binder.bind_plugin_class(QuietPlugin)
+    framework.binder.bind_plugin_class(LoudPlugin)
+    dispatcher = _make_dispatcher(framework)
+
+    await dispatcher.dispatch_event(_event("hello"))
+
+    assert created == []
+    assert seen_events == ["message.group"]
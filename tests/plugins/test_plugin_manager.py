@@ -11,7 +11,8 @@ import pytest
 
 from packages.app import NekoBotFramework
 from packages.plugins import PluginReloader
-from packages.plugins.manager import PluginManager
+from packages.plugins.manager import PluginManager, _remove_tree
+from packages.plugins.reloader import PluginMetadata
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -280,6 +281,112 @@ async def test_uninstall_keep_files(tmp_path: Path) -> None:
     assert plugin_dir.exists()  # files kept
 
 
+# ---------------------------------------------------------------------------
+# directory removal (runs in a worker thread)
+# ---------------------------------------------------------------------------
+
+
+def _mock_download_session(zip_bytes: bytes) -> AsyncMock:
+    mock_resp = AsyncMock()
+    mock_resp.status = 200
+    mock_resp.content.iter_chunked = MagicMock(return_value=_async_iter([zip_bytes]))
+    mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
+    mock_resp.__aexit__ = AsyncMock(return_value=False)
+
+    mock_session = AsyncMock()
+    mock_session.get = MagicMock(return_value=mock_resp)
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=False)
+    return mock_session
+
+
+@pytest.mark.asyncio
+async def test_remove_tree_deletes_nested_directory(tmp_path: Path) -> None:
+    target = tmp_path / "plugin"
+    (target / "sub" / "__pycache__").mkdir(parents=True)
+    (target / "sub" / "__pycache__" / "x.pyc").write_bytes(b"")
+    (target / "__init__.py").write_text("")
+
+    await _remove_tree(target)
+
+    assert not target.exists()
+
+
+@pytest.mark.asyncio
+async def test_remove_tree_ignore_errors(tmp_path: Path) -> None:
+    missing = tmp_path / "missing"
+
+    await _remove_tree(missing, ignore_errors=True)
+    with pytest.raises(FileNotFoundError):
+        await _remove_tree(missing)
+
+
+@pytest.mark.asyncio
+async def test_install_dependency_failure_rolls_back(tmp_path: Path) -> None:
+    zip_bytes = _make_plugin_zip("dep_plugin", nested=False)
+
+    with (
+        patch("packages.plugins.manager.aiohttp.ClientSession",
+              return_value=_mock_download_session(zip_bytes)),
+        patch.object(PluginManager, "_resolve_download_url", new_callable=AsyncMock,
+                     return_value="https://example.com/dep_plugin.zip"),
+        patch("packages.plugins.manager.install_plugin_dependencies",
+              new_callable=AsyncMock, return_value=False),
+    ):
+        manager, _ = _make_manager(tmp_path)
+        result = await manager.install("https://example.com/dep_plugin.zip", dir_name="dep_plugin")
+
+    assert result is False
+    assert not (tmp_path / "dep_plugin").exists()
+
+
+@pytest.mark.asyncio
+async def test_install_load_failure_rolls_back(tmp_path: Path) -> None:
+    zip_bytes = _make_plugin_zip("broken_plugin", nested=False)
+
+    with (
+        patch("packages.plugins.manager.aiohttp.ClientSession",
+              return_value=_mock_download_session(zip_bytes)),
+        patch.object(PluginManager, "_resolve_download_url", new_callable=AsyncMock,
+                     return_value="https://example.com/broken_plugin.zip"),
+        patch("packages.plugins.manager.install_plugin_dependencies",
+              new_callable=AsyncMock, return_value=True),
+        patch.object(PluginReloader, "load", side_effect=RuntimeError("boom")),
+    ):
+        manager, _ = _make_manager(tmp_path)
+        result = await manager.install(
+            "https://example.com/broken_plugin.zip", dir_name="broken_plugin"
+        )
+
+    assert result is False
+    assert not (tmp_path / "broken_plugin").exists()
+
+
+@pytest.mark.asyncio
+async def test_update_removes_old_files_before_reinstall(tmp_path: Path) -> None:
+    manager, reloader = _make_manager(tmp_path)
+    plugin_dir = tmp_path / "my_plugin"
+    plugin_dir.mkdir()
+    (plugin_dir / "__init__.py").write_text("")
+    reloader.register_metadata("my_plugin", PluginMetadata(
+        name="my-plugin", version="0.1.0", description="", author="tester",
+        repository="https://github.com/tester/my_plugin",
+    ))
+    reloader._source["my-plugin"] = f"{tmp_path.name}.my_plugin"
+
+    existed_at_install: list[bool] = []
+
+    async def _fake_install(url: str, **_: object) -> bool:
+        existed_at_install.append(plugin_dir.exists())
+        return True
+
+    with patch.object(manager, "install", side_effect=_fake_install):
+        result = await manager.update("my-plugin")
+
+    assert result is True
+    assert existed_at_install == [False]
+
+
 # ---------------------------------------------------------------------------
 # list_installed
 # ---------------------------------------------------------------------------
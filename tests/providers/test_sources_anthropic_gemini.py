@@ -115,6 +115,28 @@ async def test_anthropic_build_messages_and_tools() -> None:
     assert first_tool.get("input_schema") == {"type": "object"}
 
 
+async def test_anthropic_attaches_images_to_last_user_message_only() -> None:
+    provider = AnthropicHarness(config={"api_key": "x"})
+    request = ProviderRequest(
+        messages=[
+            ChatMessage(role="user", content="first"),
+            ChatMessage(role="assistant", content="reply"),
+            ChatMessage(role="user", content="second"),
+        ],
+        image_urls=["data:image/png;base64,AAAA"],
+    )
+
+    messages = await provider.build_messages_for_test(request)
+    first_message = cast(dict[str, object], cast(object, messages[0]))
+    last_message = cast(dict[str, object], cast(object, messages[-1]))
+
+    assert first_message["content"] == "first"
+    assert last_message["content"] == [
+        {"type": "text", "text": "second"},
+        {"type": "image", "source": {"type": "base64", "media_type": "image/png", "data": "AAAA"}},
+    ]
+
+
 def test_anthropic_provider_info_includes_models() -> None:
     provider = AnthropicHarness(config={"api_key": "x"})
 
@@ -172,6 +194,27 @@ def test_gemini_build_contents_and_tools() -> None:
     assert tools[0].function_declarations[0].name == "weather"
 
 
+def test_gemini_attaches_images_to_last_user_message_only() -> None:
+    provider = GeminiHarness(config={"api_key": "x"})
+    request = ProviderRequest(
+        messages=[
+            ChatMessage(role="user", content="first"),
+            ChatMessage(role="assistant", content="reply"),
+            ChatMessage(role="user", content="second"),
+        ],
+        image_urls=["data:image/png;base64,AAAA"],
+    )
+
+    contents = provider.build_contents_for_test(request)
+
+    assert contents[0].parts is not None
+    assert len(contents[0].parts) == 1
+    assert contents[-1].parts is not None
+    assert contents[-1].parts[0].text == "second"
+    assert contents[-1].parts[1].inline_data is not None
+    assert contents[-1].parts[1].inline_data.mime_type == "image/png"
+
+
 def test_gemini_parse_tool_calls_extracts_function_call_data() -> None:
     provider = GeminiHarness(config={"api_key": "x"})
     response = FakeGeminiResponse(
@@ -90,6 +90,29 @@ def test_openai_build_tools_maps_tool_definitions_to_function_payloads() -> None
     assert function_payload.get("description") == "Get weather"
 
 
+def test_openai_build_tools_reuses_payloads_for_same_definitions() -> None:
+    provider = OpenAIHarness(config={"api_key": "x"})
+    weather = ToolDefinition(name="weather", description="Get weather")
+    clock = ToolDefinition(name="clock", description="Get time")
+
+    first = provider.build_tools_for_test([weather])
+    again = provider.build_tools_for_test([weather])
+    changed = provider.build_tools_for_test([weather, clock])
+
+    assert again == first
+    assert again is not first
+    assert again[0] is first[0]
+    assert [cast(dict, cast(object, p))["function"]["name"] for p in changed] == [
+        "weather",
+        "clock",
+    ]
+    # 内容相同但对象不同的定义不会命中缓存
+    rebuilt = provider.build_tools_for_test(
+        [ToolDefinition(name="weather", description="Get weather")]
+    )
+    assert rebuilt[0] is not first[0]
+
+
 def test_openai_parse_tool_calls_extracts_arguments_from_json() -> None:
     provider = OpenAIHarness(config={"api_key": "x"})
     tool_calls = [
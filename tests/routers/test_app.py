@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from packages import __version__
+from packages.app import NekoBotFramework
+from packages.conversations.persistence import InMemoryConversationStore
+from packages.routers.app import _scan_static_files, create_app
+
+
+def _app():
+    return create_app(NekoBotFramework(conversation_store=InMemoryConversationStore()))
+
+
+def test_create_app_registers_every_route_blueprint() -> None:
+    app = _app()
+
+    assert {"auth", "configs", "conversations", "personas", "logs", "system"} <= set(app.blueprints)
+    assert app.blueprints["system"].url_prefix == "/api/v1/system"
+
+
+async def test_ping_reports_package_version() -> None:
+    client = _app().test_client()
+
+    response = await client.get("/api/v1/ping")
+
+    assert response.status_code == 200
+    assert await response.get_json() == {"success": True, "message": "pong", "version": __version__}
+
+
+async def test_json_responses_keep_key_order_and_raw_unicode() -> None:
+    app = _app()
+
+    async with app.app_context():
+        body = app.json.dumps({"success": False, "message": "未找到"})
+
+    assert body == '{"success": false, "message": "未找到"}'
+
+
+async def test_cors_headers_for_allowed_origin() -> None:
+    client = _app().test_client()
+
+    response = await client.get("/api/v1/ping", headers={"Origin": "http://localhost:6285"})
+
+    assert response.headers["Access-Control-Allow-Origin"] == "http://localhost:6285"
+    assert response.headers["Access-Control-Allow-Methods"] == "GET, POST, OPTIONS, PUT, DELETE"
+    assert response.headers["Vary"] == "Origin"
+
+
+async def test_cors_headers_omitted_for_unknown_origin() -> None:
+    client = _app().test_client()
+
+    response = await client.get("/api/v1/ping", headers={"Origin": "http://evil.example"})
+
+    assert "Access-Control-Allow-Origin" not in response.headers
+
+
+async def test_api_http_errors_use_json_envelope() -> None:
+    client = _app().test_client()
+
+    response = await client.post(
+        "/api/v1/auth/token",
+        data="{not json",
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 400
+    body = await response.get_json()
+    assert body["success"] is False
+    assert body["message"]
+
+
+async def test_api_method_not_allowed_uses_json_envelope() -> None:
+    client = _app().test_client()
+
+    response = await client.delete("/api/v1/ping")
+
+    assert response.status_code == 405
+    assert (await response.get_json())["success"] is False
+
+
+def _spa_app(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, *, with_index: bool = True):
+    dist = tmp_path / "dist"
+    (dist / "assets").mkdir(parents=True)
+    (dist / "assets" / "app.js").write_text("console.log(1)")
+    if with_index:
+        (dist / "index.html").write_text("<html>index</html>")
+    (tmp_path / "secret.txt").write_text("top secret")
+    monkeypatch.setenv("NEKOBOT_DIST_DIR", str(dist))
+    return _app()
+
+
+async def test_spa_serves_assets_and_falls_back_to_index(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    client = _spa_app(monkeypatch, tmp_path).test_client()
+
+    asset = await client.get("/assets/app.js")
+    deep_link = await client.get("/settings/providers")
+
+    assert await asset.get_data() == b"console.log(1)"
+    assert await deep_link.get_data() == b"<html>index</html>"
+
+
+@pytest.mark.parametrize("path", ["/..%2fsecret.txt", "/%2e%2e/secret.txt", "/assets/..%2f..%2fsecret.txt"])
+async def test_spa_does_not_serve_files_outside_dist(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, path: str
+) -> None:
+    client = _spa_app(monkeypatch, tmp_path).test_client()
+
+    response = await client.get(path)
+
+    assert b"top secret" not in await response.get_data()
+
+
+async def test_spa_index_supports_etag_revalidation(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    client = _spa_app(monkeypatch, tmp_path).test_client()
+
+    first = await client.get("/")
+    etag = first.headers["ETag"]
+    revalidated = await client.get("/some/route", headers={"If-None-Match": etag})
+
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert first.content_type.startswith("text/html")
+    assert revalidated.status_code == 304
+    assert await revalidated.get_data() == b""
+
+
+async def test_spa_without_index_returns_404(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    client = _spa_app(monkeypatch, tmp_path, with_index=False).test_client()
+
+    response = await client.get("/")
+
+    assert response.status_code == 404
+
+
+def test_scan_static_files_lists_relative_posix_paths(tmp_path: Path) -> None:
+    (tmp_path / "assets" / "img").mkdir(parents=True)
+    (tmp_path / "index.html").write_text("x")
+    (tmp_path / "assets" / "app.js").write_text("x")
+    (tmp_path / "assets" / "img" / "logo.png").write_bytes(b"x")
+
+    assert _scan_static_files(tmp_path) == {"index.html", "assets/app.js", "assets/img/logo.png"}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -14,8 +15,10 @@ from packages.routers.auth_store import (
 
 
 @pytest.fixture(autouse=True)
-async def reset_auth_state():
+async def reset_auth_state(monkeypatch: pytest.MonkeyPatch):
     """Reset module-level connection state before and after each test."""
+    # 测试只关心正确性，用最低成本因子避免每次哈希耗时数百毫秒
+    monkeypatch.setattr(auth_store_mod, "_BCRYPT_ROUNDS", 4)
     await close_auth_db()
     yield
     await close_auth_db()
@@ -26,6 +29,27 @@ async def test_default_credentials_accepted(tmp_path: Path) -> None:
     assert await verify_password("nekobot", "nekobot", db_path=db) is True
 
 
+async def test_concurrent_first_logins_seed_default_user_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    db = tmp_path / "auth.sqlite3"
+    real_hash = auth_store_mod._hash_password
+
+    async def slow_hash(password: str) -> bytes:
+        # 模拟 12 轮 bcrypt 的耗时，让两次首次登录在 SELECT 与 INSERT 之间交错
+        await asyncio.sleep(0.05)
+        return await real_hash(password)
+
+    monkeypatch.setattr(auth_store_mod, "_hash_password", slow_hash)
+
+    results = await asyncio.gather(
+        verify_password("nekobot", "nekobot", db_path=db),
+        verify_password("nekobot", "nekobot", db_path=db),
+    )
+
+    assert results == [True, True]
+
+
 async def test_wrong_password_rejected(tmp_path: Path) -> None:
     db = tmp_path / "auth.sqlite3"
     await init_auth_db(db_path=db)
@@ -65,3 +89,29 @@ async def test_close_resets_connection_state(tmp_path: Path) -> None:
 
     # Should be usable again after close
     assert await verify_password("nekobot", "nekobot", db_path=db) is True
+
+
+def test_jwt_secret_prefers_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(auth_store_mod, "_JWT_SECRET_FILE", tmp_path / "jwt_secret.key")
+    monkeypatch.setenv("NEKOBOT_JWT_SECRET", "from-env")
+
+    assert auth_store_mod.load_jwt_secret() == "from-env"
+    assert not (tmp_path / "jwt_secret.key").exists()
+
+
+def test_jwt_secret_generated_once_and_persisted(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    secret_file = tmp_path / "jwt_secret.key"
+    monkeypatch.setattr(auth_store_mod, "_JWT_SECRET_FILE", secret_file)
+    monkeypatch.delenv("NEKOBOT_JWT_SECRET", raising=False)
+
+    first = auth_store_mod.load_jwt_secret()
+
+    assert len(first) == 64
+    assert secret_file.read_text() == first
+    assert auth_store_mod.load_jwt_secret() == first
+
+
+@pytest.mark.parametrize(("value", "expected"), [("", 12), ("10", 10), ("3", 12), ("abc", 12)])
+def test_bcrypt_rounds_reads_env(monkeypatch: pytest.MonkeyPatch, value: str, expected: int) -> None:
+    monkeypatch.setenv("NEKOBOT_BCRYPT_ROUNDS", value)
+    assert auth_store_mod._bcrypt_rounds() == expected
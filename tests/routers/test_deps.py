@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+
+import jwt
+import pytest
+
+from packages.routers import deps
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> Iterator[None]:
+    deps.clear_token_cache()
+    yield
+    deps.clear_token_cache()
+
+
+def _token(exp: float, secret: str | None = None) -> str:
+    return jwt.encode({"sub": "admin", "exp": int(exp)}, secret or deps.jwt_secret(), algorithm="HS256")
+
+
+def _count_decodes(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+    real_decode = jwt.decode
+
+    def counting_decode(token: str, *args: object, **kwargs: object) -> dict:
+        calls.append(token)
+        return real_decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(deps.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_decode_token_caches_verified_claims(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_decodes(monkeypatch)
+    token = _token(time.time() + 3600)
+
+    first = deps._decode_token(token)
+    second = deps._decode_token(token)
+
+    assert first is not None and first["sub"] == "admin"
+    assert second == first
+    assert len(calls) == 1
+
+
+def test_decode_token_entry_does_not_outlive_token_exp(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_decodes(monkeypatch)
+    now = time.time()
+    token = _token(now + 5)
+    assert deps._decode_token(token) is not None
+
+    # 只推进缓存使用的时钟：超过 exp 后必须重新走完整校验
+    monkeypatch.setattr(deps.time, "time", lambda: now + 10)
+    deps._decode_token(token)
+
+    assert len(calls) == 2
+
+
+def test_decode_token_rejects_bad_signature_without_caching(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_decodes(monkeypatch)
+    token = _token(time.time() + 3600, secret="not-the-secret-" * 3)
+
+    assert deps._decode_token(token) is None
+    assert deps._decode_token(token) is None
+    assert len(calls) == 2
+
+
+def test_token_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(deps, "_TOKEN_CACHE_MAX", 2)
+    exp = time.time() + 3600
+    tokens = [jwt.encode({"sub": f"u{i}", "exp": int(exp)}, deps.jwt_secret(), algorithm="HS256") for i in range(3)]
+
+    for token in tokens:
+        deps._decode_token(token)
+
+    assert list(deps._token_cache) == tokens[1:]
+
+
+def test_jwt_secret_is_loaded_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    loads: list[None] = []
+
+    def fake_load() -> str:
+        loads.append(None)
+        return "s" * 48
+
+    deps.jwt_secret.cache_clear()
+    monkeypatch.setattr(deps, "load_jwt_secret", fake_load)
+    try:
+        assert deps.jwt_secret() == deps.jwt_secret() == "s" * 48
+        assert len(loads) == 1
+    finally:
+        deps.jwt_secret.cache_clear()
+
+
+@pytest.mark.parametrize("claims", [{"sub": "admin"}, {"exp": 2**31 - 1}])
+def test_decode_token_requires_exp_and_sub(claims: dict[str, object]) -> None:
+    token = jwt.encode(claims, deps.jwt_secret(), algorithm="HS256")
+
+    assert deps._decode_token(token) is None
+    assert token not in deps._token_cache
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from packages.routers.routes.log_router import _scan_log_files, _tail_file
+
+
+def test_scan_log_files_lists_files_sorted_and_skips_dirs(tmp_path: Path) -> None:
+    (tmp_path / "b.log").write_text("bb")
+    (tmp_path / "a.log").write_text("a")
+    (tmp_path / "archive").mkdir()
+
+    files = _scan_log_files(tmp_path)
+
+    assert [f["name"] for f in files] == ["a.log", "b.log"]
+    assert [f["size_bytes"] for f in files] == [1, 2]
+    assert all(isinstance(f["modified_at"], float) for f in files)
+
+
+def test_scan_log_files_missing_dir_is_empty(tmp_path: Path) -> None:
+    assert _scan_log_files(tmp_path / "missing") == []
+
+
+def test_tail_file_returns_last_lines(tmp_path: Path) -> None:
+    path = tmp_path / "x.log"
+    path.write_text("".join(f"line {i}\n" for i in range(10)))
+
+    assert _tail_file(path, 3) == ["line 7", "line 8", "line 9"]
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import pytest
+
+from packages.routers.routes.schema_router import _infer_field
+
+
+@pytest.mark.parametrize("key", ["api_key", "AccessToken", "client_SECRET", "db_password", "credentials"])
+def test_infer_field_marks_secret_like_keys_as_password(key: str) -> None:
+    assert _infer_field(key, "value")["type"] == "password"
+
+
+def test_infer_field_plain_string_and_scalars() -> None:
+    assert _infer_field("base_url", "https://x")["type"] == "string"
+    assert _infer_field("notes", "x" * 200)["type"] == "text"
+    assert _infer_field("enabled", True)["type"] == "bool"
+    assert _infer_field("max_tokens", 10)["type"] == "int"
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import sys
+import time
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from packages.routers.routes import system_router
+from packages.routers.routes.system_router import _uptime_seconds
+
+
+def test_uptime_seconds_uses_monotonic_start() -> None:
+    start = time.monotonic() - 5.0
+
+    uptime = _uptime_seconds(start)
+
+    assert uptime is not None
+    assert 5.0 <= uptime < 60.0
+
+
+def test_uptime_seconds_without_start_is_none() -> None:
+    assert _uptime_seconds(None) is None
+
+
+class _FakeProcess:
+    def __init__(self) -> None:
+        self.cpu_calls = 0
+
+    def cpu_percent(self, interval: float | None = None) -> float:
+        assert interval is None
+        self.cpu_calls += 1
+        return 12.5
+
+    def memory_info(self) -> SimpleNamespace:
+        return SimpleNamespace(rss=1, vms=2)
+
+
+def test_resource_usage_reuses_one_primed_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: list[_FakeProcess] = []
+    vm_calls: list[None] = []
+
+    def make_process() -> _FakeProcess:
+        created.append(_FakeProcess())
+        return created[-1]
+
+    def virtual_memory() -> SimpleNamespace:
+        vm_calls.append(None)
+        return SimpleNamespace(total=10, available=4, percent=60.0)
+
+    fake = ModuleType("psutil")
+    fake.Process = make_process  # type: ignore[attr-defined]
+    fake.virtual_memory = virtual_memory  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "psutil", fake)
+    monkeypatch.setattr(system_router, "_process", None)
+    monkeypatch.setattr(system_router, "_psutil_missing", False)
+
+    first = system_router._sample_resources()
+    second = system_router._sample_resources()
+
+    assert len(created) == 1
+    assert created[0].cpu_calls == 3  # 1 次建立基准 + 每次请求 1 次
+    assert len(vm_calls) == 2
+    assert second == first == {
+        "memory": {"rss_bytes": 1, "vms_bytes": 2},
+        "cpu_percent": 12.5,
+        "system_memory": {"total": 10, "available": 4, "percent": 60.0},
+    }
+
+
+def test_resource_usage_without_psutil(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "psutil", None)
+    monkeypatch.setattr(system_router, "_psutil_missing", False)
+
+    assert system_router._sample_resources() == {"memory": None, "system_memory": None}
+    assert system_router._psutil_missing is True
+
+    # 已确认缺失后不再尝试导入：即使模块随后可用也不会被加载
+    monkeypatch.setitem(sys.modules, "psutil", ModuleType("psutil"))
+    assert system_router._sample_resources() == {"memory": None, "system_memory": None}
+
+
+def test_resource_usage_reuses_sample_within_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    samples: list[dict] = []
+
+    def sample() -> dict:
+        samples.append({"n": len(samples)})
+        return samples[-1]
+
+    clock = [100.0]
+    monkeypatch.setattr(system_router, "_sample_resources", sample)
+    monkeypatch.setattr(system_router, "_resource_cache", None)
+    monkeypatch.setattr(system_router.time, "monotonic", lambda: clock[0])
+
+    first = system_router._resource_usage()
+    clock[0] += 0.5
+    cached = system_router._resource_usage()
+    clock[0] += 1.0
+    refreshed = system_router._resource_usage()
+
+    assert cached is first
+    assert refreshed == {"n": 1}
@@ -108,6 +108,37 @@ def test_command_registry_last_registration_wins_for_same_name() -> None:
     assert entry.plugin_name == "plugin_b"
 
 
+def test_command_registry_unregister_restores_shadowed_command() -> None:
+    reg = CommandRegistry()
+    reg.register("plugin_a", (("h1", _cmd_spec("ping")),))
+    reg.register("plugin_b", (("h2", _cmd_spec("ping")),))
+
+    reg.unregister_plugin("plugin_b")
+    entry = reg.resolve("ping")
+    assert entry is not None
+    assert entry.plugin_name == "plugin_a"
+
+    reg.register("plugin_b", (("h2", _cmd_spec("ping")),))
+    reg.unregister_plugin("plugin_a")
+    entry = reg.resolve("ping")
+    assert entry is not None
+    assert entry.plugin_name == "plugin_b"
+
+
+def test_command_registry_conflicts_tracked_incrementally() -> None:
+    reg = CommandRegistry()
+    reg.register("plugin_a", (("h1", _cmd_spec("ping", aliases=("p",))),))
+    reg.register("plugin_b", (("h2", _cmd_spec("pong", aliases=("p",))),))
+    assert reg.conflicts().keys() == {"p"}
+    assert [e.plugin_name for e in reg.conflicts()["p"]] == ["plugin_a", "plugin_b"]
+
+    reg.unregister_plugin("plugin_a")
+    assert reg.conflicts() == {}
+    entry = reg.resolve("p")
+    assert entry is not None
+    assert entry.plugin_name == "plugin_b"
+
+
 def test_command_entry_fields() -> None:
     spec = _cmd_spec("ping")
     entry = CommandEntry(plugin_name="p", handler_name="h", spec=spec)
@@ -196,6 +227,15 @@ def test_event_handler_registry_unregister_plugin() -> None:
     assert reg.resolve("message") == []
 
 
+def test_event_handler_registry_unregister_plugin_with_repeated_event() -> None:
+    reg = EventHandlerRegistry()
+    reg.register("p", (("h1", _evt_spec("message")), ("h2", _evt_spec("message"))))
+    reg.register("q", (("h3", _evt_spec("message")),))
+    reg.unregister_plugin("p")
+    assert [e.handler_name for e in reg.resolve("message")] == ["h3"]
+    assert len(reg) == 1
+
+
 def test_event_handler_registry_unregister_unknown_plugin_noop() -> None:
     reg = EventHandlerRegistry()
     reg.unregister_plugin("ghost")  # must not raise
@@ -211,6 +251,39 @@ def test_event_handler_registry_unregister_only_removes_own_handlers() -> None:
     assert results[0].plugin_name == "plugin_b"
 
 
+def test_event_handler_registry_orders_by_priority_then_registration() -> None:
+    reg = EventHandlerRegistry()
+    reg.register(
+        "plugin_a",
+        (
+            ("low", EventHandlerSpec(event="message", priority=0)),
+            ("high", EventHandlerSpec(event="message", priority=10)),
+            ("low2", EventHandlerSpec(event="message", priority=0)),
+        ),
+    )
+    assert [r.handler_name for r in reg.resolve("message")] == ["high", "low", "low2"]
+
+    reg.register("plugin_b", (("mid", EventHandlerSpec(event="message.group", priority=5)),))
+    assert [r.handler_name for r in reg.resolve("message.group")] == ["high", "mid", "low", "low2"]
+
+
+def test_event_handler_registry_resolve_returns_a_copy() -> None:
+    reg = EventHandlerRegistry()
+    reg.register("plugin_a", (("on_msg", _evt_spec("message")),))
+    reg.resolve("message").clear()
+    assert len(reg.resolve("message")) == 1
+
+def test_event_handler_registry_resolve_cache_invalidated_on_changes() -> None:
+    reg = EventHandlerRegistry()
+    reg.register("plugin_a", (("h_a", _evt_spec("message")),))
+    assert [r.handler_name for r in reg.resolve("message.group")] == ["h_a"]
+
+    reg.register("plugin_b", (("h_b", _evt_spec("message.group")),))
+    assert [r.handler_name for r in reg.resolve("message.group")] == ["h_a", "h_b"]
+
+    reg.unregister_plugin("plugin_a")
+    assert [r.handler_name for r in reg.resolve("message.group")] == ["h_b"]
+
 def test_event_handler_entry_fields() -> None:
     spec = _evt_spec("message")
     entry = EventHandlerEntry(plugin_name="p", handler_name="h", spec=spec)
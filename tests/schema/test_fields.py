@@ -153,6 +153,12 @@ def test_object_schema_reports_extra_fields_by_default() -> None:
     assert any("not declared" in i.message for i in issues)
 
 
+def test_object_schema_reports_extra_fields_in_payload_order() -> None:
+    schema = ObjectSchema(fields={"name": StringField()})
+    issues = schema.validate({"z": 1, "name": "x", "a": 2})
+    assert [i.path for i in issues] == ["z", "a"]
+
+
 def test_object_schema_allow_extra_suppresses_extra_field_error() -> None:
     schema = ObjectSchema(fields={"name": StringField()}, allow_extra=True)
     assert schema.validate({"name": "x", "extra": "y"}) == []
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from packages.skills.manager import SkillManager
+
+
+def _write_skill(path: Path, name: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _ = path.write_text(
+        f"---\nname: {name}\ndescription: {name} skill\n---\nbody of {name}\n",
+        encoding="utf-8",
+    )
+
+
+async def test_load_all_scans_top_level_and_one_subdir_level(tmp_path: Path) -> None:
+    _write_skill(tmp_path / "top.md", "top")
+    _write_skill(tmp_path / "lower" / "skill.md", "lower")
+    _write_skill(tmp_path / "upper" / "SKILL.md", "upper")
+    _write_skill(tmp_path / "deep" / "nested" / "skill.md", "deep")
+    _ = (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    manager = SkillManager(framework=None, data_dir=str(tmp_path))  # type: ignore[arg-type]
+    await manager.load_all()
+
+    assert sorted(s.name for s in manager.list_skills()) == ["lower", "top", "upper"]
+    skill = manager.get_skill("lower")
+    assert skill is not None
+    assert skill.content == "body of lower"
+
+
+async def test_load_all_creates_missing_directory(tmp_path: Path) -> None:
+    target = tmp_path / "skills"
+    manager = SkillManager(framework=None, data_dir=str(target))  # type: ignore[arg-type]
+
+    await manager.load_all()
+
+    assert target.is_dir()
+    assert manager.list_skills() == []
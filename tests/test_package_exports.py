@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import packages
+
+
+def test_lazy_exports_resolve_to_submodule_objects() -> None:
+    from packages.app import NekoBotFramework
+
+    assert packages.NekoBotFramework is NekoBotFramework
+    assert "NekoBotFramework" in dir(packages)
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError):
+        _ = packages.DoesNotExist  # type: ignore[attr-defined]
+
+
+def test_import_packages_does_not_load_framework() -> None:
+    code = "import sys, packages; print('packages.app' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_import_tools_does_not_load_mcp_sdk() -> None:
+    code = (
+        "import sys, packages.tools; "
+        "print('mcp' in sys.modules, 'packages.tools.mcp.manager' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False False"
+
+
+def test_tools_lazy_exports_resolve_to_submodule_objects() -> None:
+    import packages.tools
+    from packages.tools.mcp.manager import MCPManager
+
+    assert packages.tools.MCPManager is MCPManager
+    assert "MCPManager" in dir(packages.tools)
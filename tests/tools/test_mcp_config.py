@@ -0,0 +1,27 @@
+"""Tests for MCPServerConfig."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from packages.tools.mcp.types import MCPServerConfig
+
+
+def test_server_config_is_immutable() -> None:
+    cfg = MCPServerConfig(name="fs", transport="stdio", command=["npx"])
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.enabled = False  # type: ignore[misc]
+    assert not hasattr(cfg, "__dict__")
+
+
+def test_server_config_replace_keeps_other_fields() -> None:
+    cfg = MCPServerConfig(name="search", transport="http", url="http://localhost:8080/mcp")
+
+    disabled = dataclasses.replace(cfg, enabled=False)
+
+    assert disabled.enabled is False
+    assert disabled.url == cfg.url
+    assert cfg.enabled is True
@@ -0,0 +1,70 @@
+"""Tests for MCPManager server bookkeeping (transport clients are faked)."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from packages.tools.mcp.manager import MCPManager
+from packages.tools.mcp.types import MCPServerConfig
+from packages.tools.registry import ToolEntry, ToolRegistry
+
+
+class FakeClient:
+    def __init__(self, config: MCPServerConfig) -> None:
+        self.config = config
+        self._tools: list[ToolEntry] = []
+        self.started = False
+        self.stopped = False
+
+    async def start(self) -> None:
+        self.started = True
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+    async def refresh(self) -> None:
+        pass
+
+    async def list_tools(self) -> list[ToolEntry]:
+        return list(self._tools)
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> object:
+        return None
+
+
+def _config(name: str) -> MCPServerConfig:
+    return MCPServerConfig(name=name, transport="stdio", command=["true"])
+
+
+async def test_connected_servers_tracks_add_and_remove() -> None:
+    manager = MCPManager(ToolRegistry())
+
+    with patch("packages.tools.mcp.manager._make_client", side_effect=FakeClient):
+        assert await manager.add_server(_config("a")) is True
+        assert await manager.add_server(_config("b")) is True
+
+    assert manager.connected_servers == ("a", "b")
+    # 未发生变更时返回同一个快照
+    assert manager.connected_servers is manager.connected_servers
+
+    await manager.remove_server("a")
+    assert manager.connected_servers == ("b",)
+
+
+async def test_stop_all_disconnects_every_server() -> None:
+    manager = MCPManager(ToolRegistry())
+    clients: list[FakeClient] = []
+
+    def _make(config: MCPServerConfig) -> FakeClient:
+        client = FakeClient(config)
+        clients.append(client)
+        return client
+
+    with patch("packages.tools.mcp.manager._make_client", side_effect=_make):
+        await manager.load([_config("a"), _config("b")])
+
+    await manager.stop_all()
+
+    assert manager.connected_servers == ()
+    assert all(c.stopped for c in clients)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from packages.tools.mcp.server import PluginMCPServer
+from packages.tools.registry import ToolRegistry
+
+
+def _register(registry: ToolRegistry, plugin_name: str, tool_name: str) -> None:
+    async def handler(query: str) -> str:
+        return query
+
+    registry.register_tool(
+        plugin_name=plugin_name,
+        tool_name=tool_name,
+        description=f"{tool_name} tool",
+        parameters_schema={"type": "object", "properties": {"query": {"type": "string"}}},
+        handler=handler,
+    )
+
+
+async def test_sync_tracks_added_and_removed_tools() -> None:
+    registry = ToolRegistry()
+    _register(registry, "a", "search")
+    _register(registry, "b", "lookup")
+    server = PluginMCPServer(registry)
+
+    server.sync()
+    assert server.tool_names == ["search", "lookup"]
+    assert {t.name for t in await server._mcp.list_tools()} == {"search", "lookup"}
+
+    registry.unregister_plugin("a")
+    server.sync()
+    assert server.tool_names == ["lookup"]
+    assert {t.name for t in await server._mcp.list_tools()} == {"lookup"}
+
+
+async def test_sync_tool_handlers_are_callable_over_mcp() -> None:
+    registry = ToolRegistry()
+
+    def shout(text: str) -> str:
+        return text.upper()
+
+    registry.register_tool(
+        plugin_name="p",
+        tool_name="shout",
+        description="upper-case text",
+        parameters_schema={"type": "object", "properties": {"text": {"type": "string"}}},
+        handler=shout,
+    )
+    server = PluginMCPServer(registry)
+    server.sync()
+
+    result = await server._mcp.call_tool("shout", {"text": "hi"})
+
+    assert "HI" in str(result)
+
+
+async def test_sync_wrapper_returning_coroutine_is_awaited_over_mcp() -> None:
+    registry = ToolRegistry()
+
+    async def _shout(text: str) -> str:
+        return text.upper()
+
+    def shout(text: str) -> object:
+        return _shout(text)
+
+    registry.register_tool(
+        plugin_name="p",
+        tool_name="shout",
+        description="upper-case text",
+        parameters_schema={"type": "object", "properties": {"text": {"type": "string"}}},
+        handler=shout,
+    )
+    server = PluginMCPServer(registry)
+    server.sync()
+
+    result = await server._mcp.call_tool("shout", {"text": "hi"})
+
+    assert "HI" in str(result)
+    assert "coroutine" not in str(result)
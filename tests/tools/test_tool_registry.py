@@ -0,0 +1,222 @@
+"""Tests for ToolRegistry registration, definitions and dispatch."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from packages.providers.types import ToolCall
+from packages.tools.registry import ToolEntry, ToolRegistry
+
+
+class FakeBackend:
+    def __init__(self, entries: list[ToolEntry]) -> None:
+        self._entries = entries
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def list_tools(self) -> list[ToolEntry]:
+        return list(self._entries)
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> object:
+        self.calls.append((name, arguments))
+        return {"echo": arguments}
+
+
+def _mcp_entry(name: str) -> ToolEntry:
+    async def _unused(**_: object) -> object:
+        return None
+
+    return ToolEntry(
+        name=name,
+        description=f"{name} from mcp",
+        parameters_schema={"type": "object", "properties": {}},
+        handler=_unused,
+        plugin_name="__mcp__",
+        backend="mcp:srv",
+    )
+
+
+def _register_add(registry: ToolRegistry, plugin_name: str = "math") -> None:
+    async def add(plugin: object, a: int, b: int) -> int:
+        return a + b
+
+    registry.register_tool(
+        plugin_name=plugin_name,
+        tool_name="add",
+        description="add two ints",
+        parameters_schema={"type": "object", "properties": {"a": {"type": "integer"}, "b": {"type": "integer"}}},
+        handler=add,
+    )
+
+
+def test_empty_registry_has_no_definitions() -> None:
+    registry = ToolRegistry()
+    assert registry.get_tool_definitions() == []
+    assert len(registry) == 0
+
+
+async def test_dispatch_plugin_tool() -> None:
+    registry = ToolRegistry()
+    _register_add(registry)
+
+    result = await registry.dispatch(ToolCall(id="1", name="add", arguments={"a": 1, "b": 2}), object())
+
+    assert result == "3"
+
+
+async def test_dispatch_unknown_tool_returns_error() -> None:
+    registry = ToolRegistry()
+
+    result = await registry.dispatch(ToolCall(id="1", name="nope", arguments={}))
+
+    assert json.loads(str(result)) == {"error": "unknown tool: nope"}
+
+
+async def test_sync_backends_exposes_and_dispatches_backend_tools() -> None:
+    registry = ToolRegistry()
+    backend = FakeBackend([_mcp_entry("search")])
+    registry.add_backend("srv", backend)
+
+    await registry.sync_backends()
+
+    assert [d.name for d in registry.get_tool_definitions()] == ["search"]
+    assert len(registry) == 1
+    result = await registry.dispatch(ToolCall(id="1", name="search", arguments={"q": "x"}))
+    assert json.loads(str(result)) == {"echo": {"q": "x"}}
+    assert backend.calls == [("search", {"q": "x"})]
+
+
+async def test_unregister_plugin_removes_its_tools() -> None:
+    registry = ToolRegistry()
+    _register_add(registry)
+
+    assert registry.unregister_plugin("math") == 1
+    assert registry.get_tool_definitions() == []
+
+
+class FailingBackend:
+    async def list_tools(self) -> list[ToolEntry]:
+        raise ConnectionError("down")
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> object:
+        raise AssertionError("unreachable")
+
+
+async def test_sync_backends_skips_failing_backend() -> None:
+    registry = ToolRegistry()
+    registry.add_backend("broken", FailingBackend())
+    registry.add_backend("srv", FakeBackend([_mcp_entry("search"), _mcp_entry("fetch")]))
+
+    await registry.sync_backends()
+
+    assert sorted(d.name for d in registry.get_tool_definitions()) == ["fetch", "search"]
+
+
+async def test_dispatch_supports_sync_tool_handlers() -> None:
+    registry = ToolRegistry()
+
+    def upper(plugin: object, text: str) -> str:
+        return text.upper()
+
+    registry.register_tool(
+        plugin_name="text",
+        tool_name="upper",
+        description="upper-case text",
+        parameters_schema={"type": "object", "properties": {"text": {"type": "string"}}},
+        handler=upper,
+    )
+
+    result = await registry.dispatch(ToolCall(id="1", name="upper", arguments={"text": "neko"}), object())
+
+    assert result == "NEKO"
+
+
+async def test_dispatch_awaits_sync_wrapper_returning_coroutine() -> None:
+    registry = ToolRegistry()
+
+    async def _lookup(text: str) -> str:
+        return text[::-1]
+
+    def lookup(plugin: object, text: str) -> Any:
+        # 形如重试 / 超时装饰器：普通函数，但返回协程
+        return _lookup(text)
+
+    registry.register_tool(
+        plugin_name="text",
+        tool_name="reverse",
+        description="reverse text",
+        parameters_schema={"type": "object", "properties": {"text": {"type": "string"}}},
+        handler=lookup,
+    )
+
+    result = await registry.dispatch(ToolCall(id="1", name="reverse", arguments={"text": "neko"}), object())
+
+    assert result == "oken"
+
+
+async def test_dispatch_tool_exception_returns_error_json() -> None:
+    registry = ToolRegistry()
+
+    async def boom(plugin: object) -> str:
+        raise RuntimeError("kaput")
+
+    registry.register_tool(
+        plugin_name="p", tool_name="boom", description="", parameters_schema={}, handler=boom,
+    )
+
+    result = await registry.dispatch(ToolCall(id="1", name="boom", arguments={}), object())
+
+    assert json.loads(str(result)) == {"error": "kaput"}
+
+
+async def test_tool_definitions_are_cached_until_registry_changes() -> None:
+    registry = ToolRegistry()
+    _register_add(registry)
+    first = registry.get_tool_definitions()
+    version = registry.version
+
+    second = registry.get_tool_definitions()
+    assert second == first
+    assert second[0] is first[0]
+    assert registry.version == version
+
+    registry.add_backend("srv", FakeBackend([_mcp_entry("search")]))
+    await registry.sync_backends()
+    assert registry.version > version
+    assert [d.name for d in registry.get_tool_definitions()] == ["add", "search"]
+
+    registry.unregister_plugin("math")
+    assert [d.name for d in registry.get_tool_definitions()] == ["search"]
+
+
+def test_tool_entry_precomputes_its_definition() -> None:
+    entry = _mcp_entry("search")
+
+    assert entry.definition.name == "search"
+    assert entry.definition.description == "search from mcp"
+    assert entry.definition.parameters is entry.parameters_schema
+
+
+async def test_dispatch_prefers_first_registered_plugin_tool() -> None:
+    registry = ToolRegistry()
+
+    async def first(plugin: object) -> str:
+        return "first"
+
+    async def second(plugin: object) -> str:
+        return "second"
+
+    for plugin_name, handler in (("p1", first), ("p2", second)):
+        registry.register_tool(
+            plugin_name=plugin_name,
+            tool_name="dup",
+            description="",
+            parameters_schema={"type": "object", "properties": {}},
+            handler=handler,
+        )
+    call = ToolCall(id="1", name="dup", arguments={})
+
+    assert await registry.dispatch(call, plugin_instance=object()) == "first"
+
+    registry.unregister_plugin("p1")
+    assert await registry.dispatch(call, plugin_instance=object()) == "second"
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+
+from packages.utils.conv_lock import ConversationLockManager
+
+
+async def test_same_key_is_serialized_and_released() -> None:
+    manager = ConversationLockManager()
+    order: list[str] = []
+    entered = asyncio.Event()
+
+    async def first() -> None:
+        async with manager.acquire("conv"):
+            order.append("first:start")
+            entered.set()
+            await asyncio.sleep(0.01)
+            order.append("first:end")
+
+    async def second() -> None:
+        await entered.wait()
+        async with manager.acquire("conv"):
+            order.append("second")
+
+    await asyncio.gather(first(), second())
+
+    assert order == ["first:start", "first:end", "second"]
+    assert manager.active_count() == 0
+
+
+async def test_distinct_keys_are_tracked_separately() -> None:
+    manager = ConversationLockManager()
+
+    async with manager.acquire("a"), manager.acquire("b"):
+        assert manager.active_count() == 2
+
+    assert manager.active_count() == 0